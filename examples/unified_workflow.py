@@ -144,7 +144,7 @@ def globoid_example():
 
     # Save and load
     save_design_json(design, "/tmp/globoid_design.json")
-    loaded = load_design_json("/tmp/globoid_design.json")
+    loaded = load_design_json("/tmp/globoid_design.json", trusted=True)
 
     # Generate globoid geometry
     print("\n2. Generate globoid worm...")
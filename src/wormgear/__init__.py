@@ -95,27 +95,32 @@ def __getattr__(name):
         if "enums" not in _modules:
             from . import enums
             _modules["enums"] = enums
-        return getattr(_modules["enums"], name)
+        value = getattr(_modules["enums"], name)
 
-    if name in _CALCULATOR:
+    elif name in _CALCULATOR:
         if "calculator" not in _modules:
             from . import calculator
             _modules["calculator"] = calculator
-        return getattr(_modules["calculator"], name)
+        value = getattr(_modules["calculator"], name)
 
-    if name in _IO:
+    elif name in _IO:
         if "io" not in _modules:
             from . import io
             _modules["io"] = io
-        return getattr(_modules["io"], name)
+        value = getattr(_modules["io"], name)
 
-    if name in _CORE:
+    elif name in _CORE:
         if "core" not in _modules:
             from . import core
             _modules["core"] = core
-        return getattr(_modules["core"], name)
+        value = getattr(_modules["core"], name)
 
-    raise AttributeError(f"module 'wormgear' has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module 'wormgear' has no attribute {name!r}")
+
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -3,48 +3,225 @@ Command-line interface for worm gear geometry generation.
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import os
 import sys
 from pathlib import Path
 
-from ..io.loaders import (
-    load_design_json,
-    save_design_json,
-    WormGearDesign,
-    ManufacturingParams,
-    ManufacturingFeatures
-)
 from ..enums import WormType, WormProfile, BoreType
-from ..core.worm import WormGeometry
-from ..core.globoid_worm import GloboidWormGeometry
-from ..core.wheel import WheelGeometry
-from ..core.virtual_hobbing import VirtualHobbingWheelGeometry
-from ..core.features import (
-    BoreFeature,
-    KeywayFeature,
-    DDCutFeature,
-    SetScrewFeature,
-    HubFeature,
-    calculate_default_bore,
-    calculate_default_ddcut,
-    get_din_6885_keyway,
-    get_set_screw_size
-)
-from ..core.mesh_alignment import (
-    find_optimal_mesh_rotation,
-    position_for_mesh,
-    mesh_alignment_to_dict,
-)
-from ..core.rim_thickness import (
-    measure_rim_thickness,
-    rim_thickness_to_dict,
-    WHEEL_RIM_WARNING_THRESHOLD_MM,
-    WORM_RIM_WARNING_THRESHOLD_MM,
-)
-from ..io.loaders import MeshAlignment, WormPosition, MeasuredGeometry, MeasurementPoint
 
+# Geometry modules (wormgear.core) pull in build123d/OCCT, which takes seconds
+# to import, and the design loaders pull in Pydantic. Both are imported inside
+# main() once arguments have been parsed, so --help and usage errors return
+# immediately.
 
-def main():
-    """Main CLI entry point."""
+# Argument choices (tuples rather than sets so --help lists them in order)
+_PROFILE_CHOICES = ('ZA', 'ZK', 'ZI', 'za', 'zk', 'zi')
+_HUB_TYPE_CHOICES = ('flush', 'extended', 'flanged')
+
+
+def _export_step_atomic(part, output_file: Path, write_pcurves: bool = True):
+    """Export a STEP file via a temporary file and rename.
+
+    Readers (and interrupted runs) never see a partially written STEP file.
+    """
+    from build123d import export_step
+
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+    try:
+        export_step(part, str(tmp_file), write_pcurves=write_pcurves)
+        os.replace(tmp_file, output_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _build_geometry_brep(geometry, step_file=None, write_pcurves: bool = True) -> bytes:
+    """Build a geometry generator and return the part as BREP bytes.
+
+    Runs in a worker process. build123d parts produced by boolean operations
+    cannot be pickled, so the result is sent back serialized as BREP. If
+    step_file is given the worker also writes the STEP file, so exports for
+    parts built in parallel run in parallel too.
+    """
+    from build123d import export_brep
+
+    part = geometry.build()
+    if step_file is not None:
+        _export_step_atomic(part, step_file, write_pcurves)
+    buffer = io.BytesIO()
+    export_brep(part, buffer)
+    return buffer.getvalue()
+
+
+def _part_from_brep(data: bytes):
+    """Rebuild a part from BREP bytes returned by a worker process."""
+    from build123d import Compound
+    from OCP.BRep import BRep_Builder
+    from OCP.BRepTools import BRepTools
+    from OCP.TopoDS import TopoDS_Shape
+
+    shape = TopoDS_Shape()
+    BRepTools.Read_s(shape, io.BytesIO(data), BRep_Builder())
+    return Compound.cast(shape)
+
+
+# Options that only affect reporting, or where and whether files are written -
+# everything else can change the geometry or STEP content
+_NON_GEOMETRY_ARGS = frozenset({
+    'output_dir', 'jobs', 'view', 'no_save', 'verbose', 'quiet', 'force',
+    'cache', 'save_json', 'skip_mesh_alignment',
+})
+
+
+def _step_fingerprint(args: argparse.Namespace) -> str:
+    """Hash the design path and geometry options that STEP exports depend on."""
+    from ..core.build_cache import geometry_cache_key
+
+    options = {
+        name: value for name, value in vars(args).items()
+        if name not in _NON_GEOMETRY_ARGS
+    }
+    options['design_file'] = str(Path(args.design_file).resolve())
+    return geometry_cache_key("step", **options)
+
+
+def _fingerprint_file(output_file: Path) -> Path:
+    """File holding the options fingerprint of a STEP export.
+
+    Kept in the wormgear cache, keyed by the resolved output path, so the
+    output directory only ever holds the STEP files themselves.
+    """
+    from ..core.build_cache import DEFAULT_CACHE_DIR
+
+    path_key = hashlib.blake2b(
+        str(Path(output_file).resolve()).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return DEFAULT_CACHE_DIR / "step" / f"{path_key}.key"
+
+
+def _save_fingerprint(output_file: Path, fingerprint: str):
+    """Record the options a STEP file was exported with (best effort)."""
+    fingerprint_file = _fingerprint_file(output_file)
+    try:
+        fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+        fingerprint_file.write_text(fingerprint)
+    except OSError:
+        pass  # Without a fingerprint the file is simply re-exported next time
+
+
+def _step_up_to_date(output_file: Path, design_mtime_ns: int, fingerprint: str) -> bool:
+    """Check a STEP file is newer than the design and was built with the same options."""
+    try:
+        return (
+            output_file.stat().st_mtime_ns > design_mtime_ns
+            and _fingerprint_file(output_file).read_text() == fingerprint
+        )
+    except OSError:
+        return False
+
+
+def _report_built(name: str, part, verbose: bool):
+    """Print a progress line for a built part (volume only when verbose)."""
+    if verbose:
+        print(f"  {name.capitalize()} built - Volume: {part.volume:.2f} mm³")
+    else:
+        print(f"  {name.capitalize()} built")
+
+
+def _build_parts(
+    pending: dict,
+    jobs: int,
+    verbose: bool = False,
+    step_files: dict = None,
+    write_pcurves: bool = True,
+) -> tuple[dict, set]:
+    """Build pending geometry generators, in parallel where possible.
+
+    Args:
+        pending: Mapping of part name ('worm', 'wheel') to geometry generator
+        jobs: Maximum number of worker processes
+        verbose: Report part volumes (mass-property integration over the BRep)
+        step_files: Mapping of part name to STEP path for workers to export
+        write_pcurves: Write p-curves in worker STEP exports
+
+    Returns:
+        Tuple of (mapping of part name to built part, names whose STEP file
+        was written by a worker)
+    """
+    step_files = step_files or {}
+    parts = {}
+    exported = set()
+    worker_error = None
+    if jobs > 1 and len(pending) > 1:
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
+        # Parts that cannot be pickled are left to the serial loop below.
+        # Checked up front: a pickling error surfaces from the pool exactly
+        # like an exception raised by the build itself.
+        submittable = {}
+        for name, geometry in pending.items():
+            try:
+                pickle.dumps(geometry)
+            except Exception as e:
+                print(
+                    f"  {name.capitalize()} cannot be sent to a worker ({e}), "
+                    "building in-process"
+                )
+                continue
+            submittable[name] = geometry
+
+        try:
+            if len(submittable) > 1:
+                executor = ProcessPoolExecutor(max_workers=min(jobs, len(submittable)))
+                try:
+                    futures = {
+                        executor.submit(
+                            _build_geometry_brep, geometry, step_files.get(name), write_pcurves
+                        ): name
+                        for name, geometry in submittable.items()
+                    }
+                    for future in as_completed(futures):
+                        name = futures[future]
+                        try:
+                            part = _part_from_brep(future.result())
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            # Raised by the build itself - rebuilding in-process
+                            # would only repeat a slow failure
+                            worker_error = e
+                            break
+                        pending[name].adopt_part(part)
+                        parts[name] = part
+                        if name in step_files:
+                            exported.add(name)
+                        _report_built(name, part, verbose)
+                finally:
+                    # After a build error, report it without waiting for the
+                    # other part's build to finish
+                    executor.shutdown(wait=worker_error is None, cancel_futures=True)
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            # No process support (e.g. Pyodide) - fall back to building serially
+            print(f"  Parallel build unavailable ({e}), building serially")
+    if worker_error is not None:
+        raise worker_error
+
+    for name, geometry in pending.items():
+        if name in parts:
+            continue
+        part = geometry.build()
+        parts[name] = part
+        _report_built(name, part, verbose)
+    return parts, exported
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(
         description="Generate CNC-ready STEP files for worm gear pairs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -139,6 +316,13 @@ Examples:
         help='Generate only the wheel'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=2,
+        help='Worker processes for building worm and wheel in parallel (default: 2, 1 = serial)'
+    )
+
     parser.add_argument(
         '--view',
         action='store_true',
@@ -151,6 +335,39 @@ Examples:
         help='Do not save STEP files (use with --view)'
     )
 
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Report extra detail such as part volumes'
+    )
+
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Suppress progress output (errors and warnings are still reported)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-export STEP files even if they are up to date (parts are still built '
+             'every run for the rim and mesh checks; only the STEP write is skipped)'
+    )
+
+    parser.add_argument(
+        '--compact-step',
+        action='store_true',
+        help='Omit parametric surface curves from STEP files (about half the size)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse cylindrical worm and helical/hobbed wheel geometry built by earlier runs '
+             'with identical parameters '
+             '(stored in ~/.cache/wormgear)'
+    )
+
     parser.add_argument(
         '--save-json',
         type=str,
@@ -179,7 +396,7 @@ Examples:
     parser.add_argument(
         '--profile',
         type=str,
-        choices=['ZA', 'ZK', 'ZI', 'za', 'zk', 'zi'],
+        choices=_PROFILE_CHOICES,
         default=None,
         help='Tooth profile type per DIN 3975: ZA=straight flanks/CNC (default), ZK=circular arc/3D print, ZI=involute/hobbing'
     )
@@ -278,7 +495,7 @@ Examples:
     parser.add_argument(
         '--hub-type',
         type=str,
-        choices=['flush', 'extended', 'flanged'],
+        choices=_HUB_TYPE_CHOICES,
         default='flush',
         help='Hub type for wheel mounting (default: flush)'
     )
@@ -318,12 +535,55 @@ Examples:
         help='Bolt hole diameter in mm (for flanged hub, default: auto-sized)'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built on first use and reused by later in-process calls to main()
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def main():
+    """Main CLI entry point."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args()
+
+    if args.quiet:
+        # Discard progress output only; errors and warnings are printed to
+        # stderr so they are still reported
+        with contextlib.redirect_stdout(io.StringIO()):
+            return _generate(args)
+    return _generate(args)
+
+
+def _generate(args: argparse.Namespace) -> int:
+    """Generate geometry for parsed command-line arguments."""
+    from ..io.loaders import (
+        load_design_json,
+        save_design_json,
+        WormGearDesign,
+        ManufacturingParams,
+        ManufacturingFeatures,
+        MeasuredGeometry,
+        MeasurementPoint,
+    )
+    from ..core.features import (
+        BoreFeature,
+        KeywayFeature,
+        DDCutFeature,
+        SetScrewFeature,
+        HubFeature,
+        calculate_default_bore,
+        calculate_default_ddcut,
+        get_din_6885_keyway,
+    )
 
     # Load design
     try:
         print(f"Loading design from {args.design_file}...")
         design = load_design_json(args.design_file)
+        design_mtime_ns = Path(args.design_file).stat().st_mtime_ns
     except Exception as e:
         print(f"Error loading design: {e}", file=sys.stderr)
         return 1
@@ -334,6 +594,8 @@ Examples:
 
     worm = None
     wheel = None
+    # Geometry generators waiting to be built, keyed by part name
+    pending_builds = {}
     worm_rim_result = None
     wheel_rim_result = None
     worm_bore_diameter = None
@@ -434,10 +696,18 @@ Examples:
                                     count=args.set_screw_count
                                 )
                             else:
-                                print(f"  WARNING: Invalid set screw size '{args.set_screw_size}', using auto-size")
+                                print(
+                                    f"  WARNING: Invalid set screw size '{args.set_screw_size}', "
+                                    "using auto-size",
+                                    file=sys.stderr,
+                                )
                                 worm_set_screw = SetScrewFeature(count=args.set_screw_count)
                         except ValueError:
-                            print(f"  WARNING: Could not parse set screw size '{args.set_screw_size}', using auto-size")
+                            print(
+                                "  WARNING: Could not parse set screw size "
+                                f"'{args.set_screw_size}', using auto-size",
+                                file=sys.stderr,
+                            )
                             worm_set_screw = SetScrewFeature(count=args.set_screw_count)
                     elif json_set_screw:
                         # Use JSON set screw spec
@@ -484,6 +754,7 @@ Examples:
 
         profile = use_profile
         if use_globoid:
+            from ..core.globoid_worm import GloboidWormGeometry
             worm_geo = GloboidWormGeometry(
                 params=design.worm,
                 assembly_params=design.assembly,
@@ -497,6 +768,8 @@ Examples:
                 profile=profile
             )
         else:
+            from ..core.worm import WormGeometry
+            from ..core.build_cache import DEFAULT_CACHE_DIR
             worm_geo = WormGeometry(
                 params=design.worm,
                 assembly_params=design.assembly,
@@ -506,11 +779,16 @@ Examples:
                 keyway=worm_keyway,
                 ddcut=worm_ddcut,
                 set_screw=worm_set_screw,
-                profile=profile
+                profile=profile,
+                cache_dir=DEFAULT_CACHE_DIR if args.cache else None
             )
 
-        worm = worm_geo.build()
-        print(f"  Volume: {worm.volume:.2f} mm³")
+        if use_virtual_hobbing and use_globoid and generate_wheel:
+            # Globoid worm is the hob for virtual hobbing - the wheel needs it first
+            worm = worm_geo.build()
+            _report_built('worm', worm, args.verbose)
+        else:
+            pending_builds['worm'] = worm_geo
 
     # Generate wheel
     if generate_wheel:
@@ -586,10 +864,18 @@ Examples:
                                     count=args.set_screw_count
                                 )
                             else:
-                                print(f"  WARNING: Invalid set screw size '{args.set_screw_size}', using auto-size")
+                                print(
+                                    f"  WARNING: Invalid set screw size '{args.set_screw_size}', "
+                                    "using auto-size",
+                                    file=sys.stderr,
+                                )
                                 wheel_set_screw = SetScrewFeature(count=args.set_screw_count)
                         except ValueError:
-                            print(f"  WARNING: Could not parse set screw size '{args.set_screw_size}', using auto-size")
+                            print(
+                                "  WARNING: Could not parse set screw size "
+                                f"'{args.set_screw_size}', using auto-size",
+                                file=sys.stderr,
+                            )
                             wheel_set_screw = SetScrewFeature(count=args.set_screw_count)
                     elif json_set_screw:
                         size_str = json_set_screw.size.upper()
@@ -664,6 +950,7 @@ Examples:
             hob_type = "globoid" if use_globoid else "cylindrical"
             print(f"\nGenerating wheel ({design.wheel.num_teeth} teeth, module {design.wheel.module_mm}mm, VIRTUAL HOBBING [EXPERIMENTAL], {profile_desc}{features_desc})...")
             print(f"  Using {use_hobbing_steps} hobbing steps, {hob_type} hob")
+            from ..core.virtual_hobbing import VirtualHobbingWheelGeometry
             wheel_geo = VirtualHobbingWheelGeometry(
                 params=design.wheel,
                 worm_params=design.worm,
@@ -680,6 +967,8 @@ Examples:
             )
         else:
             print(f"\nGenerating wheel ({design.wheel.num_teeth} teeth, module {design.wheel.module_mm}mm, {wheel_type_desc}, {profile_desc}{features_desc})...")
+            from ..core.wheel import WheelGeometry
+            from ..core.build_cache import DEFAULT_CACHE_DIR
             wheel_geo = WheelGeometry(
                 params=design.wheel,
                 worm_params=design.worm,
@@ -691,30 +980,75 @@ Examples:
                 ddcut=wheel_ddcut,
                 set_screw=wheel_set_screw,
                 hub=wheel_hub,
-                profile=profile
+                profile=profile,
+                cache_dir=DEFAULT_CACHE_DIR if args.cache else None
             )
-        wheel = wheel_geo.build()
-        print(f"  Volume: {wheel.volume:.2f} mm³")
+        pending_builds['wheel'] = wheel_geo
 
-    # Save STEP files first (before calculations)
+    # STEP output paths. Files written after the design last changed, with
+    # the same geometry options, are skipped (make-style) unless --force is given.
+    step_files = {}
     if not args.no_save:
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
+        if generate_worm:
+            step_files['worm'] = (
+                output_dir / f"worm_m{design.worm.module_mm}_z{design.worm.num_starts}.step"
+            )
+        if generate_wheel:
+            step_files['wheel'] = (
+                output_dir / f"wheel_m{design.wheel.module_mm}_z{design.wheel.num_teeth}.step"
+            )
+    step_fingerprint = _step_fingerprint(args)
+    stale_step_files = {
+        name: output_file for name, output_file in step_files.items()
+        if args.force or not _step_up_to_date(output_file, design_mtime_ns, step_fingerprint)
+    }
+    # Drop the old fingerprint first, so an interrupted export is never
+    # mistaken for an up-to-date one
+    for output_file in stale_step_files.values():
+        with contextlib.suppress(OSError):
+            _fingerprint_file(output_file).unlink(missing_ok=True)
+
+    # Build worm and wheel (independent parts, so they can run side by side -
+    # parallel workers also write their own STEP file)
+    exported = set()
+    if pending_builds:
+        if len(pending_builds) > 1 and args.jobs > 1:
+            print(f"\nBuilding {len(pending_builds)} parts with {args.jobs} workers...")
+        try:
+            built_parts, exported = _build_parts(
+                pending_builds, args.jobs, args.verbose,
+                step_files=stale_step_files, write_pcurves=not args.compact_step
+            )
+        except RuntimeError as e:
+            # e.g. no wheel tooth space could be cut - don't export a bad part
+            print(f"Error building geometry: {e}", file=sys.stderr)
+            return 1
+        worm = built_parts.get('worm', worm)
+        wheel = built_parts.get('wheel', wheel)
 
-        from build123d import export_step
-
+    # Save STEP files first (before calculations)
+    if step_files:
         print(f"\nExporting STEP files...")
-        if worm is not None:
-            output_file = output_dir / f"worm_m{design.worm.module_mm}_z{design.worm.num_starts}.step"
-            export_step(worm, str(output_file))
-            print(f"  Saved: {output_file}")
-
-        if wheel is not None:
-            output_file = output_dir / f"wheel_m{design.wheel.module_mm}_z{design.wheel.num_teeth}.step"
-            export_step(wheel, str(output_file))
+        built = {'worm': worm, 'wheel': wheel}
+        for name, output_file in step_files.items():
+            if name not in stale_step_files:
+                print(f"  ✓ Up-to-date: {output_file} (use --force to re-export)")
+                continue
+            if name not in exported:
+                _export_step_atomic(built[name], output_file, not args.compact_step)
+            _save_fingerprint(output_file, step_fingerprint)
             print(f"  Saved: {output_file}")
 
     # Measure rim thickness (after STEP export)
+    from ..core.rim_thickness import (
+        measure_rim_thickness,
+        rim_thickness_to_dict,
+        WHEEL_RIM_WARNING_THRESHOLD_MM,
+        WORM_RIM_WARNING_THRESHOLD_MM,
+    )
+
     if worm is not None and worm_bore_diameter is not None:
         worm_rim_result = measure_rim_thickness(
             part=worm,
@@ -724,7 +1058,11 @@ Examples:
         if worm_rim_result is not None:
             print(f"\nWorm rim thickness: {worm_rim_result.minimum_thickness_mm:.2f} mm")
             if worm_rim_result.has_warning:
-                print(f"  WARNING: Below {WORM_RIM_WARNING_THRESHOLD_MM}mm threshold")
+                print(
+                    f"  WARNING: Worm rim {worm_rim_result.minimum_thickness_mm:.2f} mm is below "
+                    f"{WORM_RIM_WARNING_THRESHOLD_MM}mm threshold",
+                    file=sys.stderr,
+                )
 
     if wheel is not None and wheel_bore_diameter is not None:
         wheel_rim_result = measure_rim_thickness(
@@ -735,10 +1073,20 @@ Examples:
         if wheel_rim_result is not None:
             print(f"Wheel rim thickness: {wheel_rim_result.minimum_thickness_mm:.2f} mm")
             if wheel_rim_result.has_warning:
-                print(f"  WARNING: Below {WHEEL_RIM_WARNING_THRESHOLD_MM}mm threshold")
+                print(
+                    f"  WARNING: Wheel rim {wheel_rim_result.minimum_thickness_mm:.2f} mm is below "
+                    f"{WHEEL_RIM_WARNING_THRESHOLD_MM}mm threshold",
+                    file=sys.stderr,
+                )
 
     # Calculate mesh alignment (when both parts generated)
     # Skip for virtual hobbing by default (very slow with complex geometry)
+    from ..core.mesh_alignment import (
+        find_optimal_mesh_rotation,
+        position_for_mesh,
+        mesh_alignment_to_dict,
+    )
+
     mesh_alignment_result = None
     skip_mesh = args.skip_mesh_alignment
     if use_virtual_hobbing:
@@ -876,7 +1224,7 @@ Examples:
 
             # Print warnings for thin rims
             if (generate_worm and worm_thin_rim_warning) or (generate_wheel and wheel_thin_rim_warning):
-                print(f"\n  Warning: thin rim on small bore - handle with care")
+                print(f"\n  Warning: thin rim on small bore - handle with care", file=sys.stderr)
 
             print(f"\n  To generate solid parts: --no-bore")
 
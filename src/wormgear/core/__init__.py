@@ -27,86 +27,69 @@ Example:
 """
 
 # Bore sizing is always available (no build123d dependency)
-from .bore_sizing import calculate_default_bore
+from .bore_sizing import calculate_default_bore, calculate_default_bore_batch
 
-# Geometry classes require build123d - make import conditional
-# This allows calculator (in Pyodide) to import core.bore_sizing without build123d
-try:
-    from .worm import WormGeometry
-    from .wheel import WheelGeometry
-    from .globoid_worm import GloboidWormGeometry
-    from .virtual_hobbing import VirtualHobbingWheelGeometry, HOBBING_PRESETS, get_hobbing_preset, get_preset_steps
+# Geometry modules require build123d/OCCT, which takes seconds to import (and
+# is missing in the Pyodide calculator). Names are resolved from their
+# submodule on first access (PEP 562), so importing core.bore_sizing - e.g.
+# from the calculator - never pulls in build123d.
+_LAZY_IMPORTS = {
+    # Geometry classes
+    "WormGeometry": ".worm",
+    "WheelGeometry": ".wheel",
+    "GloboidWormGeometry": ".globoid_worm",
+    "VirtualHobbingWheelGeometry": ".virtual_hobbing",
+    "HOBBING_PRESETS": ".virtual_hobbing",
+    "get_hobbing_preset": ".virtual_hobbing",
+    "get_preset_steps": ".virtual_hobbing",
 
-    # Features (also require build123d)
-    from .features import (
-        BoreFeature,
-        KeywayFeature,
-        DDCutFeature,
-        SetScrewFeature,
-        HubFeature,
-        calculate_default_ddcut,
-        get_din_6885_keyway,
-    )
+    # Features
+    "BoreFeature": ".features",
+    "KeywayFeature": ".features",
+    "DDCutFeature": ".features",
+    "SetScrewFeature": ".features",
+    "HubFeature": ".features",
+    "calculate_default_ddcut": ".features",
+    "get_din_6885_keyway": ".features",
+    "get_din_6885_keyway_batch": ".features",
 
     # Mesh alignment
-    from .mesh_alignment import (
-        MeshAlignmentResult,
-        find_optimal_mesh_rotation,
-        calculate_mesh_rotation,
-        check_interference,
-        position_for_mesh,
-        create_axis_markers,
-        mesh_alignment_to_dict,
-    )
+    "MeshAlignmentResult": ".mesh_alignment",
+    "find_optimal_mesh_rotation": ".mesh_alignment",
+    "calculate_mesh_rotation": ".mesh_alignment",
+    "check_interference": ".mesh_alignment",
+    "position_for_mesh": ".mesh_alignment",
+    "create_axis_markers": ".mesh_alignment",
+    "mesh_alignment_to_dict": ".mesh_alignment",
 
     # Rim thickness measurement
-    from .rim_thickness import (
-        RimThicknessResult,
-        measure_rim_thickness,
-        rim_thickness_to_dict,
-        WHEEL_RIM_WARNING_THRESHOLD_MM,
-        WORM_RIM_WARNING_THRESHOLD_MM,
-    )
+    "RimThicknessResult": ".rim_thickness",
+    "measure_rim_thickness": ".rim_thickness",
+    "rim_thickness_to_dict": ".rim_thickness",
+    "WHEEL_RIM_WARNING_THRESHOLD_MM": ".rim_thickness",
+    "WORM_RIM_WARNING_THRESHOLD_MM": ".rim_thickness",
+}
 
-    __all__ = [
-        # Geometry classes
-        "WormGeometry",
-        "WheelGeometry",
-        "GloboidWormGeometry",
-        "VirtualHobbingWheelGeometry",
-        "HOBBING_PRESETS",
-        "get_hobbing_preset",
-        "get_preset_steps",
 
-        # Features
-        "BoreFeature",
-        "KeywayFeature",
-        "DDCutFeature",
-        "SetScrewFeature",
-        "HubFeature",
-        "calculate_default_bore",
-        "calculate_default_ddcut",
-        "get_din_6885_keyway",
+def __getattr__(name):
+    """Lazy load geometry names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        # Mesh alignment
-        "MeshAlignmentResult",
-        "find_optimal_mesh_rotation",
-        "calculate_mesh_rotation",
-        "check_interference",
-        "position_for_mesh",
-        "create_axis_markers",
-        "mesh_alignment_to_dict",
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
-        # Rim thickness measurement
-        "RimThicknessResult",
-        "measure_rim_thickness",
-        "rim_thickness_to_dict",
-        "WHEEL_RIM_WARNING_THRESHOLD_MM",
-        "WORM_RIM_WARNING_THRESHOLD_MM",
-    ]
-except ImportError:
-    # build123d not available (e.g., in Pyodide calculator without geometry)
-    # Only expose bore_sizing functions
-    __all__ = [
-        "calculate_default_bore",
-    ]
+
+def __dir__():
+    """List the lazy geometry names alongside the eagerly imported ones."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
+
+# Only the dependency-free names: "from wormgear.core import *" resolves every
+# name in __all__, so listing the lazy ones would import build123d eagerly.
+# Geometry names are imported explicitly (from wormgear.core import WormGeometry).
+__all__ = ["calculate_default_bore", "calculate_default_bore_batch"]
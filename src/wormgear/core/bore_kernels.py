@@ -0,0 +1,39 @@
+"""
+Numba kernels for bore sizing sweeps.
+
+calculate_default_bore_batch() uses these when numba is installed, fusing the
+whole sizing rule into one parallel loop. Importing this module fails without
+numba (e.g. in Pyodide), in which case the batch function falls back to its
+NumPy implementation.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def default_bore_kernel(
+    pitch: np.ndarray,
+    root: np.ndarray,
+    bores: np.ndarray,
+    warnings: np.ndarray,
+) -> None:
+    """
+    Fill bores/warnings with calculate_default_bore() results, elementwise.
+
+    Impossible bores are written as NaN with no warning. np.rint rounds half
+    to even, matching round() in the scalar version.
+    """
+    for i in prange(pitch.size):
+        root_diameter = root[i]
+        max_bore = root_diameter - 2 * max(root_diameter * 0.125, 1.0)
+        bore = max(2.0, min(pitch[i] * 0.25, max_bore))
+        step = 0.5 if bore < 12 else 1.0
+        bore = np.rint(bore / step) * step
+
+        if root_diameter > 0 and max_bore >= 2.0 and bore <= max_bore:
+            bores[i] = bore
+            warnings[i] = (root_diameter - bore) / 2 < 1.5
+        else:
+            bores[i] = np.nan
+            warnings[i] = False
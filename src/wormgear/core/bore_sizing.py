@@ -4,9 +4,13 @@ These are pure calculation functions that don't depend on build123d geometry.
 Used by both the calculator (web) and geometry (CLI) modules.
 """
 
+import functools
 from typing import Optional, Tuple
 
 
+# Pure function of its two floats, called repeatedly with the same values
+# (calculator validation, output and geometry all size the same bores)
+@functools.lru_cache(maxsize=256)
 def calculate_default_bore(pitch_diameter: float, root_diameter: float) -> tuple[float, bool]:
     """
     Calculate a sensible default bore diameter based on gear dimensions.
@@ -58,17 +62,15 @@ def calculate_default_bore(pitch_diameter: float, root_diameter: float) -> tuple
     # Constrain bore to valid range
     bore = max(min_bore, min(target, max_bore))
 
-    # Round to nice values
+    # Round to nice values. Rounding cannot take the bore below min_bore
+    # (a multiple of 0.5mm), so only the upper limit is rechecked below.
     if bore < 12:
         # Round to nearest 0.5mm for small/medium bores
         bore = round(bore * 2) / 2
     else:
-        # Round to nearest 1mm for larger bores
+        # Round to nearest 1mm for larger bores (kept as int, e.g. "15mm")
         bore = round(bore)
 
-    # Ensure at least min_bore after rounding
-    bore = max(min_bore, bore)
-
     # Check if bore fits within max allowed
     if bore > max_bore:
         return (None, False)
@@ -84,3 +86,52 @@ def calculate_default_bore(pitch_diameter: float, root_diameter: float) -> tuple
     has_warning = actual_rim < 1.5
 
     return (bore, has_warning)
+
+
+def calculate_default_bore_batch(pitch_diameters, root_diameters):
+    """
+    Vectorized calculate_default_bore() for parameter sweeps.
+
+    Applies the same sizing rules elementwise to arrays of gear dimensions,
+    as one parallel loop when numba is installed. NumPy is imported here
+    rather than at module level so the calculator can keep using
+    calculate_default_bore() without it.
+
+    Args:
+        pitch_diameters: Array-like of gear pitch diameters in mm
+        root_diameters: Array-like of gear root diameters in mm (same shape)
+
+    Returns:
+        Tuple of (bore_diameters, has_warnings) float and bool arrays, where
+        a bore is NaN (with no warning) wherever no bore is possible
+    """
+    import numpy as np
+
+    pitch = np.asarray(pitch_diameters, dtype=float)
+    root = np.asarray(root_diameters, dtype=float)
+
+    try:
+        from .bore_kernels import default_bore_kernel
+    except ImportError:  # numba not installed
+        pass
+    else:
+        pitch, root = np.broadcast_arrays(pitch, root)
+        bores = np.empty(pitch.shape)
+        has_warning = np.empty(pitch.shape, dtype=bool)
+        default_bore_kernel(pitch.ravel(), root.ravel(), bores.reshape(-1), has_warning.reshape(-1))
+        return bores, has_warning
+
+    min_bore = 2.0
+
+    min_rim = np.maximum(root * 0.125, 1.0)
+    max_bore = root - 2 * min_rim
+    bore = np.maximum(min_bore, np.minimum(pitch * 0.25, max_bore))
+
+    # Same rounding as the scalar version (np.round also rounds half to even)
+    step = np.where(bore < 12, 0.5, 1.0)
+    bore = np.round(bore / step) * step
+
+    possible = (root > 0) & (max_bore >= min_bore) & (bore <= max_bore)
+    has_warning = possible & ((root - bore) / 2 < 1.5)
+
+    return np.where(possible, bore, np.nan), has_warning
@@ -0,0 +1,117 @@
+"""
+Disk cache for built geometry.
+
+Building a worm (helix lofts, booleans, repair) or wheel (tooth space lofts
+and cuts) takes seconds, while the same design is often regenerated
+unchanged - e.g. when only the other part is being tweaked. Built parts are
+stored as BREP files keyed by a hash of everything that affects the geometry
+(including the geometry code itself), so later runs can load them instead of
+rebuilding.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+from enum import Enum
+from pathlib import Path
+from typing import Callable
+
+from build123d import Part, export_brep, import_brep
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "wormgear"
+
+
+def _to_jsonable(value):
+    """Convert build inputs (Pydantic models, dataclasses, enums) to JSON types."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+@functools.cache
+def _source_digest() -> str:
+    """
+    Hash of the geometry module sources.
+
+    Keys cached parts to the code that built them, so editing a geometry
+    module in a development checkout invalidates the cache without a
+    version bump.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def geometry_cache_key(kind: str, **inputs) -> str:
+    """
+    Compute a stable cache key for a geometry build.
+
+    Args:
+        kind: Geometry type (e.g. "worm", "wheel")
+        **inputs: Everything the build depends on (params, dimensions, features)
+
+    Returns:
+        Hex digest identifying the build
+    """
+    from .. import __version__
+
+    payload = {
+        "kind": kind,
+        "version": __version__,
+        "source": _source_digest(),
+        "inputs": {name: _to_jsonable(value) for name, value in inputs.items()},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def cached_build(key: str, builder: Callable[[], Part], cache_dir: Path) -> Part:
+    """
+    Return a cached part for key, building and storing it on a miss.
+
+    Cache read/write errors are logged and never fail the build.
+
+    Args:
+        key: Cache key from geometry_cache_key()
+        builder: Function that builds the part
+        cache_dir: Directory holding cached BREP files
+
+    Returns:
+        Built (or cached) part
+    """
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / f"{key}.brep"
+
+    if cache_file.is_file():
+        try:
+            part = import_brep(str(cache_file))
+            logger.info(f"Loaded cached geometry from {cache_file}")
+            return part
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable geometry cache {cache_file}: {e}")
+
+    part = builder()
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so concurrent runs never see
+        # a partially written BREP
+        tmp_file = cache_dir / f"{key}.{os.getpid()}.tmp"
+        export_brep(part, str(tmp_file))
+        os.replace(tmp_file, cache_file)
+        logger.debug(f"Cached geometry to {cache_file}")
+    except OSError as e:
+        logger.warning(f"Could not write geometry cache {cache_file}: {e}")
+
+    return part
@@ -8,12 +8,17 @@ Supports:
 - Hub options for wheel mounting (flush, extended, flanged)
 """
 
+import functools
 import math
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Optional, Tuple
+
+import numpy as np
 from build123d import (
-    Part, Cylinder, Box, Align, Axis, Location, Pos,
+    Part, Solid, Cylinder, Box, Align, Axis, Location, Plane, Pos,
 )
+from OCP.TopAbs import TopAbs_SOLID
 
 # Import bore calculation (pure geometry math)
 from .bore_sizing import calculate_default_bore
@@ -53,6 +58,35 @@ SET_SCREW_SIZES = {
 }
 
 
+def _interval_index(table: dict) -> Tuple[list, list, list]:
+    """Split a {(min, max): value} table into sorted parallel lists for bisect."""
+    ranges = sorted(table)
+    return [lo for lo, _ in ranges], [hi for _, hi in ranges], [table[r] for r in ranges]
+
+
+def _interval_lookup(index: Tuple[list, list, list], value: float):
+    """Return the value whose [min, max) range contains value, or None."""
+    mins, maxs, values = index
+    i = bisect_right(mins, value) - 1
+    if i >= 0 and mins[i] <= value < maxs[i]:
+        return values[i]
+    return None
+
+
+_DIN_6885_INDEX = _interval_index(DIN_6885_KEYWAYS)
+
+# Direct lookup of keyway dimensions by bore in half-mm steps (index = bore * 2).
+# Default bores are rounded to 0.5 mm, so the common case is a list index.
+_DIN_6885_HALF_MM = [
+    _interval_lookup(_DIN_6885_INDEX, k / 2)
+    for k in range(int(max(_DIN_6885_INDEX[1]) * 2))
+]
+
+# The same index as arrays, for vectorized lookups (rows past the end are NaN)
+_DIN_6885_MINS = np.asarray(_DIN_6885_INDEX[0], dtype=float)
+_DIN_6885_MAXS = np.asarray(_DIN_6885_INDEX[1], dtype=float)
+_DIN_6885_ROWS = np.vstack([np.asarray(_DIN_6885_INDEX[2], dtype=float), np.full(4, np.nan)])
+
 
 def get_din_6885_keyway(bore_diameter: float) -> Optional[Tuple[float, float, float, float]]:
     """
@@ -65,10 +99,28 @@ def get_din_6885_keyway(bore_diameter: float) -> Optional[Tuple[float, float, fl
         Tuple of (key_width, key_height, shaft_depth, hub_depth) in mm,
         or None if bore is outside standard range
     """
-    for (min_d, max_d), dims in DIN_6885_KEYWAYS.items():
-        if min_d <= bore_diameter < max_d:
-            return dims
-    return None
+    half_steps = bore_diameter * 2
+    if 0 <= half_steps < len(_DIN_6885_HALF_MM) and half_steps == int(half_steps):
+        return _DIN_6885_HALF_MM[int(half_steps)]
+    return _interval_lookup(_DIN_6885_INDEX, bore_diameter)
+
+
+def get_din_6885_keyway_batch(bore_diameters) -> np.ndarray:
+    """
+    Vectorized get_din_6885_keyway() for parameter sweeps.
+
+    Args:
+        bore_diameters: Array-like of bore diameters in mm
+
+    Returns:
+        Array of shape (..., 4) holding (key_width, key_height, shaft_depth,
+        hub_depth) per bore, with NaN rows where the bore is outside the
+        standard range
+    """
+    bores = np.asarray(bore_diameters, dtype=float)
+    i = np.searchsorted(_DIN_6885_MINS, bores, side="right") - 1
+    in_range = (i >= 0) & (bores < _DIN_6885_MAXS[i])
+    return _DIN_6885_ROWS[np.where(in_range, i, -1)]
 
 
 def get_set_screw_size(bore_diameter: float) -> Tuple[str, float]:
@@ -89,15 +141,24 @@ def get_set_screw_size(bore_diameter: float) -> Tuple[str, float]:
             f"Bore diameter {bore_diameter}mm is too small for set screws (min 2mm)"
         )
 
-    for (min_d, max_d), (name, diameter) in SET_SCREW_SIZES.items():
-        if min_d <= bore_diameter < max_d:
-            return (name, diameter)
-
-    # For bores larger than table, use M8
+    # Straight-line form of SET_SCREW_SIZES (ranges are contiguous) - keep
+    # the two in sync
+    if bore_diameter < 6:
+        return ("M2", 2.0)
+    if bore_diameter < 10:
+        return ("M3", 3.0)
+    if bore_diameter < 20:
+        return ("M4", 4.0)
+    if bore_diameter < 35:
+        return ("M5", 5.0)
+    if bore_diameter < 60:
+        return ("M6", 6.0)
+
+    # M8 for the largest range, and for bores larger than the table
     return ("M8", 8.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class BoreFeature:
     """
     Bore (center hole) feature specification.
@@ -120,7 +181,7 @@ class BoreFeature:
             raise ValueError(f"Bore depth must be positive, got {self.depth}")
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywayFeature:
     """
     Keyway feature specification per DIN 6885 / ISO 6885.
@@ -174,7 +235,7 @@ class KeywayFeature:
         return (width, depth)
 
 
-@dataclass
+@dataclass(slots=True)
 class SetScrewFeature:
     """
     Set screw hole feature specification for shaft retention.
@@ -225,7 +286,7 @@ class SetScrewFeature:
         return (size, diameter)
 
 
-@dataclass
+@dataclass(slots=True)
 class HubFeature:
     """
     Hub feature specification for wheel mounting.
@@ -279,7 +340,7 @@ class HubFeature:
             # Flange diameter will be validated when we know wheel size
 
 
-@dataclass
+@dataclass(slots=True)
 class DDCutFeature:
     """
     Double-D cut feature specification for small diameter anti-rotation.
@@ -419,6 +480,43 @@ def create_bore(
     Returns:
         Part with bore cut
     """
+    return part - _bore_cutter(bore, part_length, axis)
+
+
+# Rotation taking a Z-aligned shape onto each part axis (Z needs none)
+_AXIS_ROT = {Axis.X: (Axis.Y, 90), Axis.Y: (Axis.X, 90)}
+
+# Planes with their normal along each part axis, x direction matching _AXIS_ROT
+_AXIS_PLANES = {
+    Axis.X: Plane(origin=(0, 0, 0), x_dir=(0, 0, -1), z_dir=(1, 0, 0)),
+    Axis.Y: Plane(origin=(0, 0, 0), x_dir=(1, 0, 0), z_dir=(0, -1, 0)),
+    Axis.Z: Plane.XY,
+}
+
+
+def _to_axis(shape, axis: Axis):
+    """Rotate a Z-aligned shape onto the part axis."""
+    rot = _AXIS_ROT.get(axis)
+    return shape if rot is None else shape.rotate(*rot)
+
+
+def _axis_plane(axis: Axis, origin: Tuple[float, float, float] = (0, 0, 0)) -> Plane:
+    """
+    Plane whose normal is the part axis (Z, X or Y), for building cutters in place.
+
+    The x direction matches rotating a Z-aligned shape onto the axis
+    (Y by 90° for X, X by 90° for Y), so features keep their orientation.
+
+    Args:
+        axis: Part axis
+        origin: Plane origin in the plane's own (x, y, axial) coordinates
+    """
+    plane = _AXIS_PLANES.get(axis, Plane.XY)
+    return Plane(origin=plane.from_local_coords(origin), x_dir=plane.x_dir, z_dir=plane.z_dir)
+
+
+def _bore_cutter(bore: BoreFeature, part_length: float, axis: Axis = Axis.Z) -> Solid:
+    """Create the bore cylinder subtracted by create_bore()."""
     bore_radius = bore.diameter / 2
 
     if bore.through:
@@ -427,24 +525,8 @@ def create_bore(
     else:
         bore_depth = bore.depth
 
-    # Create bore cylinder
-    bore_cyl = Cylinder(
-        radius=bore_radius,
-        height=bore_depth,
-        align=(Align.CENTER, Align.CENTER, Align.CENTER)
-    )
-
-    # Rotate to correct axis if needed
-    if axis == Axis.X:
-        bore_cyl = bore_cyl.rotate(Axis.Y, 90)
-    elif axis == Axis.Y:
-        bore_cyl = bore_cyl.rotate(Axis.X, 90)
-    # Z axis is default, no rotation needed
-
-    # Subtract from part
-    result = part - bore_cyl
-
-    return result
+    # Create bore cylinder directly along the axis, centered on the origin
+    return Solid.make_cylinder(bore_radius, bore_depth, _axis_plane(axis, (0, 0, -bore_depth / 2)))
 
 
 def create_keyway(
@@ -474,6 +556,16 @@ def create_keyway(
     Returns:
         Part with keyway cut
     """
+    return part - _keyway_cutter(bore, keyway, part_length, axis)
+
+
+def _keyway_cutter(
+    bore: BoreFeature,
+    keyway: KeywayFeature,
+    part_length: float,
+    axis: Axis = Axis.Z
+) -> Solid:
+    """Create the keyway box subtracted by create_keyway()."""
     bore_radius = bore.diameter / 2
     width, depth = keyway.get_dimensions(bore.diameter)
 
@@ -483,48 +575,29 @@ def create_keyway(
     else:
         kw_length = part_length
 
-    if keyway.is_shaft:
-        # Shaft keyway (worm): cut from center axis outward
-        # The keyway slot sits at the bore surface and extends outward by 'depth'
-        # But since we have a bore hole, we need to create a slot that goes
-        # from the center through the bore and into the shaft material by 'depth'
-        #
-        # DIN 6885 t1 is measured from the shaft surface, so the bottom of the
-        # keyway is at radius = bore_radius + depth
-        keyway_box = Box(
-            bore_radius + depth,  # from center to (bore_radius + depth)
-            width,  # tangential width
-            kw_length + 1.0,  # axial length (slightly longer for clean cut)
-            align=(Align.MIN, Align.CENTER, Align.CENTER)
-        )
-        # Position starting from center (X=0), extending in +X direction
-        # No translation needed - MIN alignment puts it at origin
-    else:
-        # Hub keyway (wheel): cut into the hub material around the bore
-        # The slot extends from inside the bore outward through the hub material
-        # DIN 6885 t2 is measured from the bore surface outward
-        #
-        # To avoid a facet covering the bore, extend the box inward past the
-        # bore surface so it fully intersects with the cylindrical bore
-        keyway_box = Box(
-            bore_radius + depth,  # from center to (bore_radius + depth)
-            width,  # tangential width
-            kw_length + 1.0,  # axial length (slightly longer for clean cut)
-            align=(Align.MIN, Align.CENTER, Align.CENTER)
-        )
-        # Position starting from center (X=0), extending in +X direction
-        # No translation needed - MIN alignment puts it at origin
-
-    # Rotate to correct axis if needed
-    if axis == Axis.X:
-        keyway_box = keyway_box.rotate(Axis.Y, 90)
-    elif axis == Axis.Y:
-        keyway_box = keyway_box.rotate(Axis.X, 90)
+    # Shaft keyway (worm): the slot goes from the center through the bore and
+    # into the shaft material. DIN 6885 t1 is measured from the shaft surface,
+    # so the bottom of the keyway is at radius = bore_radius + depth.
+    #
+    # Hub keyway (wheel): the slot extends from inside the bore outward
+    # through the hub material. DIN 6885 t2 is measured from the bore surface
+    # outward. Starting the box at the center (past the bore surface) avoids a
+    # facet covering the bore.
+    #
+    # Both are the same box: from the center (X=0) out in +X to
+    # (bore_radius + depth), centered tangentially and axially.
+    box_length = bore_radius + depth
+    box_height = kw_length + 1.0  # axial length (slightly longer for clean cut)
+
+    # Build the box directly in the axis plane, corner at (0, -width/2, -height/2)
+    keyway_box = Solid.make_box(
+        box_length,
+        width,  # tangential width
+        box_height,
+        _axis_plane(axis, (0, -width / 2, -box_height / 2))
+    )
 
-    # Subtract from part
-    result = part - keyway_box
-
-    return result
+    return keyway_box
 
 
 def create_set_screw(
@@ -550,6 +623,33 @@ def create_set_screw(
     Returns:
         Part with set screw holes cut
     """
+    # Subtract all holes in a single boolean operation
+    return part - _set_screw_cutters(bore, set_screw, axis)
+
+
+@functools.lru_cache(maxsize=32)
+def _set_screw_hole(radius: float, length: float, axis: Axis) -> Solid:
+    """
+    Cylindrical set screw hole in the axis plane, starting at the axis and
+    offset by its radius in the plane's x direction.
+
+    Cached so repeated screw sizes (e.g. across a batch of designs) reuse one
+    OCCT primitive. Callers only ever get rotated copies, so the cached solid
+    is never modified.
+    """
+    return Solid.make_cylinder(
+        radius,
+        length,
+        _axis_plane(axis, (radius, 0, -length / 2))
+    )
+
+
+def _set_screw_cutters(
+    bore: BoreFeature,
+    set_screw: SetScrewFeature,
+    axis: Axis = Axis.Z
+) -> list:
+    """Create the set screw hole cylinders subtracted by create_set_screw()."""
     bore_radius = bore.diameter / 2
     screw_size, screw_diameter = set_screw.get_screw_specs(bore.diameter)
 
@@ -558,44 +658,17 @@ def create_set_screw(
     # Use a generous length to ensure they fully penetrate
     screw_hole_length = bore_radius + 10.0  # Extend 10mm beyond center
 
-    # Calculate angular positions for multiple set screws
-    # Evenly distributed around circumference
-    if set_screw.count == 1:
-        angles = [set_screw.angular_offset]
-    else:
-        # Multiple screws: distribute evenly (e.g., 2 screws = 180° apart)
-        angle_step = 360.0 / set_screw.count
-        angles = [set_screw.angular_offset + i * angle_step for i in range(set_screw.count)]
-
-    result = part
-
-    for angle in angles:
-        # Create cylindrical hole for set screw
-        # The hole is positioned at the bore surface and drilled radially inward
-        screw_hole = Cylinder(
-            radius=screw_diameter / 2,
-            height=screw_hole_length,
-            align=(Align.MIN, Align.CENTER, Align.CENTER)
-        )
+    # Angular positions, evenly distributed around the circumference
+    # (e.g., 2 screws = 180° apart; a single screw sits at angular_offset)
+    angle_step = 360.0 / set_screw.count
+    angles = [set_screw.angular_offset + i * angle_step for i in range(set_screw.count)]
 
-        # Position and orient the hole based on axis
-        if axis == Axis.Z:
-            # Part is along Z axis, set screw holes are in XY plane
-            # Rotate hole to be radial at the specified angle
-            screw_hole = screw_hole.rotate(Axis.Z, angle)
-        elif axis == Axis.X:
-            # Part is along X axis, set screw holes are in YZ plane
-            screw_hole = screw_hole.rotate(Axis.Y, 90)  # Orient along X
-            screw_hole = screw_hole.rotate(Axis.X, angle)
-        elif axis == Axis.Y:
-            # Part is along Y axis, set screw holes are in XZ plane
-            screw_hole = screw_hole.rotate(Axis.X, -90)  # Orient along Y
-            screw_hole = screw_hole.rotate(Axis.Y, angle)
-
-        # Subtract from part
-        result = result - screw_hole
+    # Each set screw is a rotated copy of one shared hole primitive
+    # (a relocated wrapper, not a new primitive)
+    base_hole = _set_screw_hole(screw_diameter / 2, screw_hole_length, axis)
 
-    return result
+    # Rotate to each angular position around the part axis
+    return [base_hole.rotate(axis, angle) for angle in angles]
 
 
 def create_ddcut(
@@ -688,26 +761,11 @@ def create_ddcut(
     # Create a cylinder at bore radius to constrain radial extent of fills
     # This prevents fills from extending beyond the nominal bore boundary
     # Height is slightly longer (+1mm) than part to ensure clean intersection at ends
-    if axis == Axis.Z:
-        bore_boundary = Cylinder(
-            radius=bore_radius,
-            height=part_length + 1.0,  # +1mm ensures clean intersection at part ends
-            align=(Align.CENTER, Align.CENTER, Align.CENTER)
-        )
-    elif axis == Axis.X:
-        bore_boundary = Cylinder(
-            radius=bore_radius,
-            height=part_length + 1.0,
-            align=(Align.CENTER, Align.CENTER, Align.CENTER)
-        )
-        bore_boundary = bore_boundary.rotate(Axis.Y, 90)
-    elif axis == Axis.Y:
-        bore_boundary = Cylinder(
-            radius=bore_radius,
-            height=part_length + 1.0,
-            align=(Align.CENTER, Align.CENTER, Align.CENTER)
-        )
-        bore_boundary = bore_boundary.rotate(Axis.X, 90)
+    bore_boundary = _to_axis(Cylinder(
+        radius=bore_radius,
+        height=part_length + 1.0,  # +1mm ensures clean intersection at part ends
+        align=(Align.CENTER, Align.CENTER, Align.CENTER)
+    ), axis)
 
     # Apply angular offset to fill boxes if specified
     if ddcut.angular_offset != 0:
@@ -780,14 +838,8 @@ def create_hub(
 
         # Position hub to extend from one face of wheel
         # Wheel is centered, so move hub to start at +face_width/2
-        if axis == Axis.Z:
-            hub_cylinder = hub_cylinder.move(Location((0, 0, wheel_face_width / 2)))
-        elif axis == Axis.X:
-            hub_cylinder = hub_cylinder.rotate(Axis.Y, 90)
-            hub_cylinder = hub_cylinder.move(Location((wheel_face_width / 2, 0, 0)))
-        elif axis == Axis.Y:
-            hub_cylinder = hub_cylinder.rotate(Axis.X, 90)
-            hub_cylinder = hub_cylinder.move(Location((0, wheel_face_width / 2, 0)))
+        hub_start = axis.direction * (wheel_face_width / 2)
+        hub_cylinder = _to_axis(hub_cylinder, axis).move(Location(hub_start))
 
         # Remove bore from hub if needed
         if bore_diameter is not None and bore_diameter > 0:
@@ -797,14 +849,7 @@ def create_hub(
                 height=bore_length,
                 align=(Align.CENTER, Align.CENTER, Align.MIN)
             )
-            if axis == Axis.Z:
-                hub_bore = hub_bore.move(Location((0, 0, wheel_face_width / 2)))
-            elif axis == Axis.X:
-                hub_bore = hub_bore.rotate(Axis.Y, 90)
-                hub_bore = hub_bore.move(Location((wheel_face_width / 2, 0, 0)))
-            elif axis == Axis.Y:
-                hub_bore = hub_bore.rotate(Axis.X, 90)
-                hub_bore = hub_bore.move(Location((0, wheel_face_width / 2, 0)))
+            hub_bore = _to_axis(hub_bore, axis).move(Location(hub_start))
 
             hub_cylinder = hub_cylinder - hub_bore
 
@@ -836,14 +881,8 @@ def create_hub(
 
         # Position flange at end of hub
         flange_position = wheel_face_width / 2 + hub.length
-        if axis == Axis.Z:
-            flange = flange.move(Location((0, 0, flange_position)))
-        elif axis == Axis.X:
-            flange = flange.rotate(Axis.Y, 90)
-            flange = flange.move(Location((flange_position, 0, 0)))
-        elif axis == Axis.Y:
-            flange = flange.rotate(Axis.X, 90)
-            flange = flange.move(Location((0, flange_position, 0)))
+        flange_start = axis.direction * flange_position
+        flange = _to_axis(flange, axis).move(Location(flange_start))
 
         # Remove center bore from flange if present
         if bore_diameter is not None and bore_diameter > 0:
@@ -852,14 +891,7 @@ def create_hub(
                 height=hub.flange_thickness + 1.0,
                 align=(Align.CENTER, Align.CENTER, Align.MIN)
             )
-            if axis == Axis.Z:
-                flange_bore = flange_bore.move(Location((0, 0, flange_position)))
-            elif axis == Axis.X:
-                flange_bore = flange_bore.rotate(Axis.Y, 90)
-                flange_bore = flange_bore.move(Location((flange_position, 0, 0)))
-            elif axis == Axis.Y:
-                flange_bore = flange_bore.rotate(Axis.X, 90)
-                flange_bore = flange_bore.move(Location((0, flange_position, 0)))
+            flange_bore = _to_axis(flange_bore, axis).move(Location(flange_start))
 
             flange = flange - flange_bore
 
@@ -926,7 +958,9 @@ def add_bore_and_keyway(
     Add bore, keyway/DD-cut, and set screw holes to a part.
 
     Convenience function that applies features in order:
-    bore → keyway/DD-cut → set screws.
+    bore → keyway/DD-cut → set screws. Bore, keyway and set screw holes are
+    subtracted together in one boolean operation (a DD-cut adds material
+    to the bored part, so with a DD-cut the bore is cut first).
 
     Note: keyway and ddcut are mutually exclusive (use one or the other).
 
@@ -959,27 +993,36 @@ def add_bore_and_keyway(
         raise ValueError("Set screw requires a bore to be specified")
 
     result = part
+    cutters = []
 
     if bore is not None:
-        result = create_bore(result, bore, part_length, axis)
+        cutters.append(_bore_cutter(bore, part_length, axis))
 
     if keyway is not None:
-        result = create_keyway(result, bore, keyway, part_length, axis)
+        cutters.append(_keyway_cutter(bore, keyway, part_length, axis))
 
     if ddcut is not None:
+        # Flats are filled into the bore, so it must be cut first
+        result = result - cutters
+        cutters = []
         result = create_ddcut(result, bore, ddcut, part_length, axis)
 
     if set_screw is not None:
-        result = create_set_screw(result, bore, set_screw, part_length, axis)
+        cutters.extend(_set_screw_cutters(bore, set_screw, axis))
+
+    if cutters:
+        result = result - cutters
 
     # Ensure we return a single Part/Solid, not a ShapeList
-    # Boolean operations can sometimes split geometry into multiple pieces
-    if hasattr(result, 'solids'):
-        solids = list(result.solids())
+    # Boolean operations can sometimes split geometry into multiple pieces.
+    # A result that is already a single solid needs no exploring.
+    if result.wrapped.ShapeType() != TopAbs_SOLID:
+        solids = result.solids()
         if len(solids) == 1:
             result = solids[0]
         elif len(solids) > 1:
-            # Return the largest solid (the main part)
+            # Return the largest solid (the main part) - volumes are only
+            # computed in this rare case
             result = max(solids, key=lambda s: s.volume)
 
     return result
@@ -0,0 +1,55 @@
+"""
+Flank sampling kernels shared by the worm and wheel profiles.
+
+Curved flanks are sampled as packed (N, 2) arrays of radial position and half
+width, then converted to point tuples for build123d once per flank.
+"""
+
+import math
+
+import numpy as np
+
+# numba is optional (not available in Pyodide) - without it the kernel below
+# runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def arc_flank_points(
+    inner: float,
+    outer: float,
+    half_root: float,
+    half_tip: float,
+    max_bulge: float,
+    num_points: int,
+) -> np.ndarray:
+    """
+    Sample a convex circular-arc (ZK) flank from root to tip.
+
+    Args:
+        inner: Root position of the flank (radial, relative to profile origin)
+        outer: Tip position of the flank
+        half_root: Half width at the root
+        half_tip: Half width at the tip
+        max_bulge: Arc deviation from the straight flank at mid-height
+        num_points: Points per flank
+
+    Returns:
+        Contiguous array of shape (num_points, 2): radial position and half
+        width. The left flank is the same points with the width negated.
+    """
+    points = np.empty((num_points, 2))
+    t = np.linspace(0.0, 1.0, num_points)
+    points[:, 0] = inner + t * (outer - inner)
+    # Straight flank plus circular arc bulge, maximum at mid-flank
+    points[:, 1] = half_root + t * (half_tip - half_root) + max_bulge * np.sin(t * math.pi)
+    return points
+
+
+def flank_tuples(points: np.ndarray, side: float) -> list:
+    """Convert packed (N, 2) flank points to tuples for build123d (side = +/-1)."""
+    return [(r, side * w) for r, w in points.tolist()]
@@ -9,12 +9,14 @@ import logging
 import math
 from typing import Optional, Literal, Callable
 from build123d import (
-    Part, Cylinder, Box, Axis, Align, BuildPart, BuildSketch, Plane, Vector,
-    BuildLine, Polyline, Line, make_face, revolve, Spline, loft, export_step, Pos,
+    Part, Box, Axis, Align, BuildPart, BuildSketch, Plane, Vector,
+    BuildLine, Polyline, Line, make_face, revolve, Spline, loft, Pos,
 )
 from ..io.loaders import WormParams, AssemblyParams
 from ..enums import Hand, WormProfile
 from .features import BoreFeature, KeywayFeature, SetScrewFeature, add_bore_and_keyway
+from .worm import _PROFILE_FACES
+from .tessellation import tessellate_part
 
 # Profile types per DIN 3975
 # ZA: Straight flanks in axial section (Archimedean) - best for CNC machining
@@ -50,7 +52,9 @@ class GloboidWormGeometry:
         ddcut: Optional['DDCutFeature'] = None,
         set_screw: Optional[SetScrewFeature] = None,
         profile: ProfileType = "ZA",
-        progress_callback: Optional[ProgressCallback] = None
+        progress_callback: Optional[ProgressCallback] = None,
+        linear_tol: float = 0.0005,
+        angular_tol: float = 0.05
     ):
         """
         Initialize globoid worm geometry generator.
@@ -71,6 +75,9 @@ class GloboidWormGeometry:
                      "ZK" - Slightly convex flanks - better for 3D printing
             progress_callback: Optional callback function(message, percent) for
                               progress reporting in WASM/browser environments.
+            linear_tol: Linear deflection for tessellation (STL/3MF export), relative
+                        to edge size as in build123d's mesh exporters (default: 0.0005)
+            angular_tol: Angular deflection for tessellation in radians (default: 0.05)
         """
         self.params = params
         self.assembly_params = assembly_params
@@ -82,6 +89,8 @@ class GloboidWormGeometry:
         self.set_screw = set_screw
         self.profile = profile.upper() if isinstance(profile, str) else profile
         self.progress_callback = progress_callback
+        self.linear_tol = linear_tol
+        self.angular_tol = angular_tol
 
         # Extract throat reduction from params (calculator-computed value)
         self.throat_reduction_mm = params.throat_reduction_mm or 0.0
@@ -170,6 +179,10 @@ class GloboidWormGeometry:
         Returns:
             build123d Part object representing the worm
         """
+        # Return cached geometry if already built
+        if self._part is not None:
+            return self._part
+
         self._report_progress(
             f"Building globoid worm (throat_pitch_radius={self.throat_pitch_radius:.2f}mm, "
             f"length={self.length:.2f}mm)...",
@@ -538,6 +551,13 @@ class GloboidWormGeometry:
         # Thread end taper: ramp down thread depth over ~1 lead at each end
         taper_length = lead  # Taper zone length at each end
 
+        # Same section profiles as the cylindrical worm (ZI uses the straight
+        # ZA profile; see worm._PROFILE_FACES), resolved once per thread
+        profile_key = self.profile.value if isinstance(self.profile, WormProfile) else self.profile
+        profile_face = _PROFILE_FACES.get(profile_key)
+        if profile_face is None:
+            raise ValueError(f"Unknown profile type: {self.profile}")
+
         logger.info(f"  Creating {num_sections} profile sections with end tapering...")
 
         for i in range(num_sections):
@@ -578,14 +598,9 @@ class GloboidWormGeometry:
             # CRITICAL: Profile plane perpendicular to helix tangent
             profile_plane = Plane(origin=point, x_dir=radial_dir, z_dir=tangent)
 
-            # Calculate local pitch radius from point position
-            local_pitch_radius = math.sqrt(point.X**2 + point.Y**2)
-
-            # Local tip and root radii with taper factor applied
+            # Local addendum and dedendum with taper factor applied
             local_addendum = addendum * taper_factor
             local_dedendum = dedendum * taper_factor
-            local_tip_radius = local_pitch_radius + local_addendum
-            local_root_radius = local_pitch_radius - local_dedendum
 
             # Validate profile is meaningful (avoid degenerate profiles)
             profile_height = local_addendum + local_dedendum
@@ -601,94 +616,15 @@ class GloboidWormGeometry:
             local_thread_half_width_root = max(0.05, thread_half_width_root * taper_factor)
             local_thread_half_width_tip = max(0.05, thread_half_width_tip * taper_factor)
 
-            # Create filled profile based on profile type
-            with BuildSketch(profile_plane) as sk:
-                with BuildLine():
-                    if self.profile == WormProfile.ZA or self.profile == "ZA":
-                        # ZA profile: Straight flanks (trapezoidal) per DIN 3975
-                        # Best for CNC machining - simple, accurate, standard
-                        root_left = (inner_r, -local_thread_half_width_root)
-                        root_right = (inner_r, local_thread_half_width_root)
-                        tip_left = (outer_r, -local_thread_half_width_tip)
-                        tip_right = (outer_r, local_thread_half_width_tip)
-
-                        Line(root_left, tip_left)      # Left flank (straight)
-                        Line(tip_left, tip_right)      # Tip
-                        Line(tip_right, root_right)    # Right flank (straight)
-                        Line(root_right, root_left)    # Root (closes)
-
-                    elif self.profile == WormProfile.ZK or self.profile == "ZK":
-                        # ZK profile: Circular arc flanks per DIN 3975 Type K
-                        # Biconical grinding wheel profile - convex circular arc
-                        # Better for 3D printing and reduces stress concentrations
-
-                        # Generate circular arc flanks
-                        num_points = 9  # Points per flank for smooth arc
-                        left_flank = []
-                        right_flank = []
-
-                        # Arc radius typically 0.4-0.5 × module for biconical cutter
-                        arc_radius = 0.45 * self.params.module_mm
-
-                        # Calculate arc center position
-                        flank_height = outer_r - inner_r
-                        flank_width_change = local_thread_half_width_root - local_thread_half_width_tip
-
-                        # Angle of straight flank for reference
-                        if flank_width_change > 0:
-                            flank_angle = math.atan(flank_width_change / flank_height)
-                        else:
-                            flank_angle = 0
-
-                        # Generate arc points
-                        for j in range(num_points):
-                            t = j / (num_points - 1)
-                            r_pos = inner_r + t * flank_height
-
-                            # Circular arc deviation from straight line
-                            linear_width = local_thread_half_width_root + t * (local_thread_half_width_tip - local_thread_half_width_root)
-
-                            # Arc bulge (circular, not parabolic)
-                            arc_param = t * math.pi  # 0 to π
-                            arc_bulge = arc_radius * 0.15 * math.sin(arc_param)  # Circular arc approximation
-
-                            width = linear_width + arc_bulge
-                            left_flank.append((r_pos, -width))
-                            right_flank.append((r_pos, width))
-
-                        # Build profile with circular arc flanks
-                        Spline(left_flank)
-                        Line(left_flank[-1], right_flank[-1])  # Tip
-                        Spline(list(reversed(right_flank)))
-                        Line(right_flank[0], left_flank[0])    # Root (closes)
-
-                    elif self.profile == WormProfile.ZI or self.profile == "ZI":
-                        # ZI profile: Involute helicoid per DIN 3975 Type I
-                        #
-                        # IMPORTANT: For worms, ZI does NOT mean curved flanks in the
-                        # axial cross-section! A worm acts like a helical rack, and a
-                        # rack's "involute" profile is a STRAIGHT LINE at the pressure angle.
-                        #
-                        # The difference between ZA and ZI for worms is in the 3D helicoid
-                        # surface geometry, not the 2D cross-section shape.
-                        #
-                        # Therefore, ZI for worms = ZA (straight trapezoidal profile)
-
-                        root_left = (inner_r, -local_thread_half_width_root)
-                        root_right = (inner_r, local_thread_half_width_root)
-                        tip_left = (outer_r, -local_thread_half_width_tip)
-                        tip_right = (outer_r, local_thread_half_width_tip)
-
-                        Line(root_left, tip_left)      # Left flank (straight)
-                        Line(tip_left, tip_right)      # Tip
-                        Line(tip_right, root_right)    # Right flank (straight)
-                        Line(root_right, root_left)    # Root (closes)
-
-                    else:
-                        raise ValueError(f"Unknown profile type: {self.profile}")
-                make_face()  # CRITICAL: Creates filled face with area
-
-            sections.append(sk.sketch.faces()[0])
+            # Create filled profile in XY and place it on the section plane
+            profile = profile_face(
+                inner_r,
+                outer_r,
+                local_thread_half_width_root,
+                local_thread_half_width_tip,
+                self.params.module_mm,
+            )
+            sections.append(profile_plane.location * profile)
 
         # Loft into solid thread (same as cylindrical worm)
         logger.info(f"  Lofting {len(sections)} sections...")
@@ -700,6 +636,14 @@ class GloboidWormGeometry:
             logger.warning(f"Loft failed: {e}")
             return None
 
+    def adopt_part(self, part: Part) -> None:
+        """Use a part built elsewhere (e.g. in a worker process) as this worm's build result."""
+        self._part = part
+
+    def tessellate(self) -> Part:
+        """Build the worm and mesh it once at linear_tol/angular_tol (see tessellation)."""
+        return tessellate_part(self.build(), self.linear_tol, self.angular_tol)
+
     def export_step(self, filename: str):
         """
         Export the worm geometry to a STEP file.
@@ -0,0 +1,31 @@
+"""
+Mesh-once tessellation for STL/3MF export.
+
+build123d's mesh exporters triangulate the shape themselves, but OCCT keeps
+the triangulation on the shape and skips faces that are already meshed at the
+requested deflection. Meshing once up front with the export tolerances lets
+both the 3MF and STL exports reuse the same triangulation.
+"""
+
+from build123d import Part
+from OCP.BRepMesh import BRepMesh_IncrementalMesh
+
+
+def tessellate_part(part: Part, linear_tol: float, angular_tol: float) -> Part:
+    """
+    Mesh a part in place at the given tolerances.
+
+    Calling this again with the same tolerances leaves the stored
+    triangulation as it is.
+
+    Args:
+        part: Built part to mesh
+        linear_tol: Linear deflection, relative to edge size as in build123d's
+                    mesh exporters
+        angular_tol: Angular deflection in radians
+
+    Returns:
+        The same part, now carrying its triangulation
+    """
+    BRepMesh_IncrementalMesh(part.wrapped, linear_tol, True, angular_tol, True)
+    return part
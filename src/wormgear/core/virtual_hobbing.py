@@ -27,7 +27,7 @@ import time
 from typing import Optional, Literal, Callable
 from build123d import (
     Part, Cylinder, Align, BuildSketch, BuildLine, Line, make_face, Spline,
-    loft, Helix, Vector, Plane, Axis, Pos, Rot, export_step,
+    loft, Helix, Vector, Plane, Axis, Pos, Rot,
 )
 from OCP.ShapeFix import ShapeFix_Shape
 from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
@@ -41,6 +41,7 @@ from .features import (
     add_bore_and_keyway,
     create_hub
 )
+from .tessellation import tessellate_part
 
 ProfileType = Literal["ZA", "ZK", "ZI"]
 
@@ -140,7 +141,9 @@ class VirtualHobbingWheelGeometry:
         hub: Optional[HubFeature] = None,
         profile: ProfileType = "ZA",
         hob_geometry: Optional[Part] = None,
-        progress_callback: Optional[ProgressCallback] = None
+        progress_callback: Optional[ProgressCallback] = None,
+        linear_tol: float = 0.0005,
+        angular_tol: float = 0.05
     ):
         """
         Initialize virtual hobbing wheel generator.
@@ -167,6 +170,9 @@ class VirtualHobbingWheelGeometry:
                          If None, creates a cylindrical hob from worm_params.
             progress_callback: Optional callback function(message, percent) for
                               progress reporting in WASM/browser environments.
+            linear_tol: Linear deflection for tessellation (STL/3MF export), relative
+                        to edge size as in build123d's mesh exporters (default: 0.0005)
+            angular_tol: Angular deflection for tessellation in radians (default: 0.05)
         """
         self.params = params
         self.worm_params = worm_params
@@ -197,6 +203,8 @@ class VirtualHobbingWheelGeometry:
         self.profile = profile.upper() if isinstance(profile, str) else profile
         self.hob_geometry = hob_geometry
         self.progress_callback = progress_callback
+        self.linear_tol = linear_tol
+        self.angular_tol = angular_tol
 
         # Set keyway as hub type if specified
         if self.keyway is not None:
@@ -367,12 +375,6 @@ class VirtualHobbingWheelGeometry:
                         arc_radius = 0.45 * self.worm_params.module_mm
 
                         flank_height = outer_r - inner_r
-                        flank_width_change = thread_half_width_root - thread_half_width_tip
-
-                        if flank_width_change > 0:
-                            flank_angle = math.atan(flank_width_change / flank_height)
-                        else:
-                            flank_angle = 0
 
                         for j in range(num_points):
                             t = j / (num_points - 1)
@@ -614,21 +616,22 @@ class VirtualHobbingWheelGeometry:
             # Hob stays at FIXED position (centre distance away, horizontal axis)
             # Hob rotates around its own axis by hob_angle
             # WHEEL rotates by wheel_angle
-            # We subtract hob from the rotated wheel position
+            # Cutting the rotated wheel and rotating it back is the same as
+            # cutting the stationary wheel with the hob rotated by -wheel_angle,
+            # which only relocates the (simpler) hob rather than the wheel
 
             # Position hob at fixed location (on X axis at centre distance)
-            # Hob axis is horizontal (along Y after Rot(X=90))
-            hob_positioned = Pos(centre_distance, 0, 0) * Rot(X=90) * Rot(Z=hob_angle) * hob
+            # Hob axis is horizontal (along Y after Rot(X=90)), then move it
+            # into the wheel's frame
+            hob_location = (
+                Rot(Z=-wheel_angle) * Pos(centre_distance, 0, 0) * Rot(X=90) * Rot(Z=hob_angle)
+            )
+            hob_positioned = hob_location * hob
 
-            # Rotate wheel to current angle, subtract hob, rotate back
-            # This is equivalent to: wheel rotates, hob cuts, result is accumulated
+            # Each cut is its own boolean: successive hob positions overlap
+            # heavily, and cutting several in one operation exhausts memory
             try:
-                # Rotate wheel to position
-                wheel_rotated = Rot(Z=wheel_angle) * wheel
-                # Subtract hob from rotated wheel
-                wheel_cut = wheel_rotated - hob_positioned
-                # Rotate back to accumulate result
-                wheel = Rot(Z=-wheel_angle) * wheel_cut
+                wheel = wheel - hob_positioned
             except Exception as e:
                 self._report_progress(f"    WARNING: Step {step} subtraction failed: {e}", -1)
 
@@ -925,6 +928,14 @@ class VirtualHobbingWheelGeometry:
         self._report_progress(f"    ✓ Virtual hobbing complete", 100.0)
         return wheel
 
+    def adopt_part(self, part: Part) -> None:
+        """Use a part built elsewhere (e.g. in a worker process) as this wheel's build result."""
+        self._part = part
+
+    def tessellate(self) -> Part:
+        """Build the wheel and mesh it once at linear_tol/angular_tol (see tessellation)."""
+        return tessellate_part(self.build(), self.linear_tol, self.angular_tol)
+
     def show(self):
         """Display the wheel in OCP viewer (requires ocp_vscode)."""
         wheel = self.build()
@@ -6,16 +6,23 @@ Creates worm wheel with two options:
 2. Hobbed/Throated: Arc-bottomed teeth that match worm curvature - better contact
 """
 
+import functools
+import io
 import logging
 import math
+import warnings
+from pathlib import Path
 from typing import Optional, Literal
+
+import numpy as np
 from build123d import (
-    Part, Cylinder, Align, Vector, Plane,
-    BuildSketch, BuildLine, Line, Spline, make_face, loft, Axis,
-    export_step,
+    Part, Cylinder, Align, Plane, Edge, Wire, Face, loft, Axis,
 )
 from ..io.loaders import WheelParams, WormParams, AssemblyParams
 from ..enums import WormProfile
+from .build_cache import cached_build, geometry_cache_key
+from .flank_kernels import arc_flank_points, flank_tuples
+from .tessellation import tessellate_part
 from .features import (
     BoreFeature,
     KeywayFeature,
@@ -32,14 +39,254 @@ ProfileType = Literal["ZA", "ZK", "ZI"]
 
 logger = logging.getLogger(__name__)
 
+# numba is optional (not available in Pyodide) - without it the sampling
+# kernel below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _involute_flank_half_widths(
+    inner: float,
+    outer: float,
+    pitch_radius: float,
+    base_radius: float,
+    pressure_angle: float,
+    half_root: float,
+    half_tip: float,
+    min_half_width: float,
+    num_points: int,
+) -> tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Sample the involute flank of a tooth space profile.
+
+    Points run from the inner to the outer profile offset (relative to the
+    pitch radius). Once the involute narrows the space below min_half_width
+    (self-intersection at small modules) the remaining points fall back to
+    straight flanks.
+
+    Args:
+        inner: Radial offset of the profile root from the pitch radius
+        outer: Radial offset of the profile tip from the pitch radius
+        pitch_radius: Wheel pitch radius in mm
+        base_radius: Base circle radius in mm
+        pressure_angle: Pressure angle in radians
+        half_root: Half space width at the root (straight flank)
+        half_tip: Half space width at the tip (straight flank)
+        min_half_width: Minimum half width to prevent degenerate geometry
+        num_points: Points per flank
+
+    Returns:
+        Tuple of (radial offsets, half widths, involute_valid)
+    """
+    t = np.linspace(0.0, 1.0, num_points)
+    r_positions = inner + t * (outer - inner)
+
+    # Actual radius from gear center
+    r_actual = pitch_radius + r_positions
+
+    # Straight flank width (fallback)
+    half_width_straight = half_root + t * (half_tip - half_root)
+    straight = np.maximum(min_half_width, half_width_straight)
+
+    # Involute function: inv(α) = tan(α) - α
+    inv_pitch = math.tan(pressure_angle) - pressure_angle
+
+    # Pressure angle at each radius; points below the base circle get 0 and
+    # use the straight flank
+    above_base = r_actual > base_radius
+    alpha_r = np.arccos(np.minimum(1.0, np.where(above_base, base_radius / r_actual, 1.0)))
+
+    # Angular position of involute relative to pitch, converted to linear
+    # width (flanks curve inward toward root)
+    delta_angle = inv_pitch - (np.tan(alpha_r) - alpha_r)
+    involute = half_width_straight - r_actual * delta_angle
+
+    # Involute causes self-intersection at small modules - from the first
+    # point where it gets too narrow, fall back to straight flanks
+    failed = above_base & (involute < min_half_width)
+    involute_valid = not failed.any()
+    valid_points = num_points if involute_valid else np.argmax(failed)
+    use_involute = above_base & (np.arange(num_points) < valid_points)
+
+    half_widths = np.where(use_involute, involute, straight)
+
+    return r_positions, half_widths, involute_valid
+
+
+@njit(cache=True, fastmath=True)
+def _wheel_section_frames(
+    num_sections: int,
+    cut_height: float,
+    twist_degrees: float,
+    inner: float,
+    throat_distance: float,
+    arc_radius: float,
+) -> np.ndarray:
+    """
+    Sample loft section frames for one twisted tooth space.
+
+    Sections are evenly spaced over the cut height (centred on Z=0) and
+    rotate linearly through the twist angle.
+
+    Args:
+        num_sections: Number of sections (>= 2)
+        cut_height: Axial length of the tooth space cut in mm
+        twist_degrees: Total twist of the tooth space over the cut height
+        inner: Root position of the profile (radial, relative to pitch radius)
+        throat_distance: For throated wheels, centre distance minus pitch
+            radius; ignored when arc_radius is 0
+        arc_radius: Throat arc radius (worm tip radius plus clearance), or 0
+            for a flat root
+
+    Returns:
+        Array of shape (num_sections, 4): Z position, cos and sin of the
+        section rotation, and root position of the section's profile
+    """
+    frames = np.empty((num_sections, 4))
+    t = np.linspace(0.0, 1.0, num_sections)
+    angle = np.radians(-twist_degrees / 2 + t * twist_degrees)
+
+    frames[:, 0] = -cut_height / 2 + t * cut_height
+    frames[:, 1] = np.cos(angle)
+    frames[:, 2] = np.sin(angle)
+
+    # For throated wheels, the root depth varies with Z position to match
+    # the worm's cylindrical surface; use the shallower of the worm surface
+    # and the calculated root
+    for i in range(num_sections):
+        root = inner
+        under_sqrt = arc_radius * arc_radius - frames[i, 0] * frames[i, 0]
+        # Guard against floating-point precision issues at the boundary
+        if under_sqrt > 0.0:
+            root = max(inner, throat_distance - math.sqrt(under_sqrt))
+        frames[i, 3] = root
+
+    return frames
+
+
+def _flank_deviation(flank: np.ndarray) -> float:
+    """Largest width deviation of (N, 2) flank points from their end-to-end chord."""
+    r = flank[:, 0]
+    w = flank[:, 1]
+    t = (r - r[0]) / (r[-1] - r[0])
+    return float(np.abs(w - (w[0] + t * (w[-1] - w[0]))).max())
+
+
+def _tooth_space_face(left_flank: list, right_flank: list, smooth: bool) -> Face:
+    """
+    Build a closed tooth space profile face in the XY plane.
+
+    Flanks run from root to tip; smooth flanks are splines through all
+    points, otherwise each flank is a line between its end points. Edges
+    are made directly rather than through BuildSketch/BuildLine, which is
+    several times slower for this many small profiles.
+    """
+    if smooth:
+        edges = [
+            Edge.make_spline(left_flank),
+            Edge.make_line(left_flank[-1], right_flank[-1]),        # Tip
+            Edge.make_spline(list(reversed(right_flank))),
+        ]
+    else:
+        edges = [
+            Edge.make_line(left_flank[0], left_flank[-1]),          # Left flank (straight)
+            Edge.make_line(left_flank[-1], right_flank[-1]),        # Tip
+            Edge.make_line(right_flank[-1], right_flank[0]),        # Right flank (straight)
+        ]
+    edges.append(Edge.make_line(right_flank[0], left_flank[0]))     # Root (closes)
+    return Face(Wire(edges))
+
+
+def _cut_tooth_spaces(blank: Part, sections: list, num_teeth: int) -> Part:
+    """
+    Loft one tooth space through the sections and cut it and its rotated
+    copies (one per tooth) from the blank.
+    """
+    space = loft(sections, ruled=True)
+    spaces = [space.rotate(Axis.Z, (360 / num_teeth) * i) for i in range(num_teeth)]
+
+    # Cut alternate spaces in one boolean each: neighbouring spaces
+    # come close at the root, and keeping them in separate operations
+    # makes the cuts much faster than all at once (or one by one)
+    return blank - spaces[0::2] - spaces[1::2]
+
+
+@functools.lru_cache(maxsize=32)
+def _wheel_blank(radius: float, height: float) -> Part:
+    """
+    Cylindrical wheel blank centred on the origin.
+
+    Cached so rebuilding the same wheel reuses one OCCT primitive. The
+    boolean cuts return new shapes, so the cached blank is never modified.
+    """
+    return Cylinder(
+        radius=radius,
+        height=height,
+        align=(Align.CENTER, Align.CENTER, Align.CENTER)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _tooth_space_dimensions(
+    face_width: float,
+    module: float,
+    tip_diameter: float,
+    root_diameter: float,
+    pitch_diameter: float,
+    pressure_angle_deg: float,
+    lead_angle_deg: float,
+    backlash: float,
+) -> tuple:
+    """
+    Scalar dimensions of the helical wheel's tooth spaces.
+
+    Pure function of the wheel parameters, cached so design sweeps that
+    rebuild the same wheel skip the recomputation.
+
+    Returns:
+        (tip_radius, root_radius, pitch_radius, twist_degrees,
+         half_root, half_tip) where half_root/half_tip are half the space
+        width at root and tip
+    """
+    tip_radius = tip_diameter / 2
+    root_radius = root_diameter / 2
+    pitch_radius = pitch_diameter / 2
+    tan_pressure = math.tan(math.radians(pressure_angle_deg))
+
+    # The wheel's helix angle equals 90° - worm lead angle
+    # This determines how much the teeth twist over the face width.
+    # At pitch radius, the teeth advance by (face_width * tan(lead_angle)) axially
+    # This corresponds to a rotation of: twist = face_width * tan(lead_angle) / pitch_radius (radians)
+    twist_radians = face_width * math.tan(math.radians(lead_angle_deg)) / pitch_radius
+    twist_degrees = math.degrees(twist_radians)
+
+    # Calculate tooth space dimensions
+    circular_pitch = math.pi * module
+    space_width_pitch = circular_pitch / 2 + backlash
+
+    # Space is wider at tip, narrower at root (inverse of tooth shape)
+    space_width_tip = space_width_pitch + 2 * (tip_radius - pitch_radius) * tan_pressure
+    space_width_root = space_width_pitch - 2 * (pitch_radius - root_radius) * tan_pressure
+    space_width_root = max(0.1 * module, space_width_root)
+
+    return (
+        tip_radius, root_radius, pitch_radius, twist_degrees,
+        space_width_root / 2, space_width_tip / 2,
+    )
+
 
 class WheelGeometry:
     """
     Generates 3D geometry for a worm wheel.
 
     Supports two tooth types:
-    - helical: Pure helical gear teeth (no throat cut) - simpler geometry
-    - hobbed: Helical teeth with toroidal throat cut - attempts to match worm
+    - helical: Pure helical gear teeth (flat root) - simpler geometry
+    - hobbed: Helical teeth whose root arcs around the worm (throated) -
+      built into the tooth space profile, not a separate cut
 
     Optionally adds bore and keyway features.
     """
@@ -56,7 +303,12 @@ class WheelGeometry:
         ddcut: Optional['DDCutFeature'] = None,
         set_screw: Optional[SetScrewFeature] = None,
         hub: Optional[HubFeature] = None,
-        profile: ProfileType = "ZA"
+        profile: ProfileType = "ZA",
+        cache_dir: Optional[Path] = None,
+        linear_tol: float = 0.0005,
+        angular_tol: float = 0.05,
+        spline_tolerance: float = 1e-3,
+        chord_tol: float = 0.03
     ):
         """
         Initialize wheel geometry generator.
@@ -74,6 +326,17 @@ class WheelGeometry:
             profile: Tooth profile type per DIN 3975:
                      "ZA" - Straight flanks (trapezoidal) - best for CNC (default)
                      "ZK" - Slightly convex flanks - better for 3D printing
+            cache_dir: Optional directory for caching built geometry between runs
+                       (see build_cache.DEFAULT_CACHE_DIR). Disabled by default.
+            linear_tol: Linear deflection for tessellation (STL/3MF export), relative
+                        to edge size as in build123d's mesh exporters (default: 0.0005)
+            angular_tol: Angular deflection for tessellation in radians (default: 0.05)
+            spline_tolerance: Curved (ZK/ZI) flanks that deviate less than this from
+                              a straight line, in mm, are drawn as lines instead of
+                              splines (default: 0.001). Use 0 to always use splines.
+            chord_tol: Maximum deviation in mm of the lofted tooth spaces from the
+                       true twisted (and throated) surface; sets the number of
+                       loft sections (default: 0.03)
         """
         self.params = params
         self.worm_params = worm_params
@@ -85,6 +348,11 @@ class WheelGeometry:
         self.set_screw = set_screw
         self.hub = hub
         self.profile = profile.upper() if isinstance(profile, str) else profile
+        self.cache_dir = cache_dir
+        self.linear_tol = linear_tol
+        self.angular_tol = angular_tol
+        self.spline_tolerance = spline_tolerance
+        self.chord_tol = chord_tol
 
         # Set keyway as hub type if specified
         if self.keyway is not None:
@@ -99,8 +367,10 @@ class WheelGeometry:
         else:
             self.face_width = face_width
 
-        # Cache for built geometry (avoids rebuilding on export)
+        # Cache for built geometry (avoids rebuilding on export), tagged with
+        # the inputs it was built from so later parameter changes rebuild
         self._part = None
+        self._part_key = None
 
     def build(self) -> Part:
         """
@@ -109,17 +379,48 @@ class WheelGeometry:
         Returns:
             build123d Part object ready for export
         """
-        # Return cached geometry if already built
-        if self._part is not None:
+        # Return cached geometry if already built from the current inputs
+        key = self._cache_key()
+        if self._part is not None and key == self._part_key:
             return self._part
 
-        # Create helical gear (throating is built into the tooth profile)
-        gear = self._create_helical_gear()
+        if self.cache_dir is not None:
+            self._part = cached_build(key, self._build_wheel, self.cache_dir)
+        else:
+            self._part = self._build_wheel()
+        self._part_key = key
+        return self._part
+
+    def _cache_key(self) -> str:
+        """Key identifying this wheel in the on-disk geometry cache."""
+        return geometry_cache_key(
+            "wheel",
+            params=self.params,
+            worm_params=self.worm_params,
+            assembly_params=self.assembly_params,
+            face_width=self.face_width,
+            throated=self.throated,
+            bore=self.bore,
+            keyway=self.keyway,
+            ddcut=self.ddcut,
+            set_screw=self.set_screw,
+            hub=self.hub,
+            profile=self.profile,
+            spline_tolerance=self.spline_tolerance,
+            chord_tol=self.chord_tol,
+        )
+
+    def _build_wheel(self) -> Part:
+        """Build the wheel geometry from scratch."""
+        blank = _wheel_blank(self.params.tip_diameter_mm / 2, self.face_width)
 
-        # Add bore, keyway, and set screw if specified
+        # Add bore, keyway, and set screw if specified. Subtraction order
+        # doesn't change the result (set screw holes may run out through the
+        # tooth spaces), so cut them from the plain blank - an order of
+        # magnitude cheaper than cutting them from the toothed wheel
         if self.bore is not None or self.keyway is not None or self.ddcut is not None or self.set_screw is not None:
-            gear = add_bore_and_keyway(
-                gear,
+            blank = add_bore_and_keyway(
+                blank,
                 part_length=self.face_width,
                 bore=self.bore,
                 keyway=self.keyway,
@@ -128,6 +429,9 @@ class WheelGeometry:
                 axis=Axis.Z
             )
 
+        # Create helical gear (throating is built into the tooth profile)
+        gear = self._create_helical_gear(blank)
+
         # Add hub if specified (additive feature, comes after subtractive features)
         if self.hub is not None:
             bore_diameter = self.bore.diameter if self.bore is not None else None
@@ -140,11 +444,9 @@ class WheelGeometry:
                 axis=Axis.Z
             )
 
-        # Cache the built geometry
-        self._part = gear
         return gear
 
-    def _create_helical_gear(self) -> Part:
+    def _create_helical_gear(self, blank: Part) -> Part:
         """
         Create helical gear by extruding and twisting tooth space profiles.
 
@@ -154,270 +456,215 @@ class WheelGeometry:
         For throated wheels, the tooth space profile has an arc at the root
         that matches the worm's curvature, creating the throat naturally
         as part of the tooth geometry.
+
+        Args:
+            blank: Wheel blank (tip diameter by face width) to cut the teeth into
+
+        Returns:
+            The blank with its tooth spaces cut
         """
         z = self.params.num_teeth
         m = self.params.module_mm
-        tip_radius = self.params.tip_diameter_mm / 2
-        root_radius = self.params.root_diameter_mm / 2
-        pitch_radius = self.params.pitch_diameter_mm / 2
-        pressure_angle = math.radians(self.assembly_params.pressure_angle_deg)
-
-        # The wheel's helix angle equals 90° - worm lead angle
-        # This determines how much the teeth twist over the face width
-        lead_angle = math.radians(self.worm_params.lead_angle_deg)
-
-        # Total twist angle over face width
-        # At pitch radius, the teeth advance by (face_width * tan(lead_angle)) axially
-        # This corresponds to a rotation of: twist = face_width * tan(lead_angle) / pitch_radius (radians)
-        twist_radians = self.face_width * math.tan(lead_angle) / pitch_radius
-        twist_degrees = math.degrees(twist_radians)
-
-        # Create gear blank
-        blank = Cylinder(
-            radius=tip_radius,
-            height=self.face_width,
-            align=(Align.CENTER, Align.CENTER, Align.CENTER)
+        (
+            tip_radius, root_radius, pitch_radius, twist_degrees,
+            half_root, half_tip,
+        ) = _tooth_space_dimensions(
+            self.face_width,
+            m,
+            self.params.tip_diameter_mm,
+            self.params.root_diameter_mm,
+            self.params.pitch_diameter_mm,
+            self.assembly_params.pressure_angle_deg,
+            self.worm_params.lead_angle_deg,
+            self.assembly_params.backlash_mm,
         )
 
-        # Calculate tooth space dimensions
-        circular_pitch = math.pi * m
-        space_width_pitch = circular_pitch / 2 + self.assembly_params.backlash_mm
-
-        # Space is wider at tip, narrower at root (inverse of tooth shape)
-        space_width_tip = space_width_pitch + 2 * (tip_radius - pitch_radius) * math.tan(pressure_angle)
-        space_width_root = space_width_pitch - 2 * (pitch_radius - root_radius) * math.tan(pressure_angle)
-        space_width_root = max(0.1 * m, space_width_root)
-
-        half_root = space_width_root / 2
-        half_tip = space_width_tip / 2
-
         # Extend cut beyond face to get clean edges
         extension = 0.5
         cut_height = self.face_width + 2 * extension
 
-        # Number of sections for lofting the twisted extrusion
-        num_sections = max(8, int(abs(twist_degrees) / 5) + 1)
+        # Profile offsets from pitch radius (in radial direction)
+        inner = root_radius - pitch_radius - 0.3  # Extend below root
+        outer = tip_radius + 0.3 - pitch_radius
 
         # For throated wheels, calculate the worm position for arc profile
         if self.throated:
-            centre_distance = self.assembly_params.centre_distance_mm
+            throat_distance = self.assembly_params.centre_distance_mm - pitch_radius
             worm_tip_radius = self.worm_params.tip_diameter_mm / 2
             # Add small clearance for fit
             arc_radius = worm_tip_radius + 0.1
+        else:
+            throat_distance = 0.0
+            arc_radius = 0.0
+
+        # Number of sections for lofting the twisted extrusion: enough that
+        # each ruled segment stays within chord_tol of the true surface.
+        # A chord spanning angle θ at the tip deviates tip_radius * θ² / 8
+        num_segments = (
+            abs(math.radians(twist_degrees)) * math.sqrt(tip_radius / (8 * self.chord_tol))
+        )
+        if self.throated:
+            # The throated root follows the worm's tip circle, so Z steps of
+            # dz deviate dz² / (8 * arc_radius) from it
+            num_segments = max(
+                num_segments, cut_height / math.sqrt(8 * arc_radius * self.chord_tol)
+            )
+        num_sections = max(2, math.ceil(num_segments) + 1)
 
-        # Cut tooth spaces
-        gear = blank
-
-        for i in range(z):
-            base_angle = (360 / z) * i
-
-            # Create sections along Z for lofting
-            sections = []
-
-            for s in range(num_sections):
-                t = s / (num_sections - 1)  # 0 to 1
-                z_pos = -cut_height / 2 + t * cut_height
-
-                # Rotation at this Z position (linear interpolation of twist)
-                rotation_at_z = -twist_degrees / 2 + t * twist_degrees
-                section_angle = base_angle + rotation_at_z
-                section_angle_rad = math.radians(section_angle)
-
-                # Create profile plane at this Z, rotated appropriately
-                radial = Vector(math.cos(section_angle_rad), math.sin(section_angle_rad), 0)
-                tangent = Vector(-math.sin(section_angle_rad), math.cos(section_angle_rad), 0)
-
-                # Profile plane: origin at pitch radius, X = radial outward, Y = tangential
-                origin = Vector(
-                    pitch_radius * math.cos(section_angle_rad),
-                    pitch_radius * math.sin(section_angle_rad),
-                    z_pos
-                )
-                profile_plane = Plane(origin=origin, x_dir=radial, z_dir=Vector(0, 0, 1))
-
-                # Profile offsets from pitch radius (in radial direction)
-                inner = root_radius - pitch_radius - 0.3  # Extend below root
-                outer = tip_radius + 0.3 - pitch_radius
-
-                # For throated wheels, the root depth varies with Z position
-                # to match the worm's cylindrical surface
-                if self.throated and abs(z_pos) < arc_radius:
-                    # Calculate where the worm surface is at this Z
-                    # Guard against floating-point precision issues at boundary
-                    under_sqrt = arc_radius**2 - z_pos**2
-                    if under_sqrt >= 0:
-                        worm_surface_dist = centre_distance - math.sqrt(under_sqrt)
-                        throated_inner = worm_surface_dist - pitch_radius
-                        # Use the shallower of the two (worm surface or calculated root)
-                        actual_inner = max(inner, throated_inner)
-                    else:
-                        # Fallback at boundary due to floating-point precision
-                        actual_inner = inner
-                else:
-                    actual_inner = inner
-
-                with BuildSketch(profile_plane) as sk:
-                    with BuildLine():
-                        if self.profile == WormProfile.ZA or self.profile == "ZA":
-                            # ZA profile: Straight flanks (trapezoidal) per DIN 3975
-                            # Best for CNC machining - simple, accurate, standard
-                            root_left = (actual_inner, -half_root)
-                            root_right = (actual_inner, half_root)
-                            tip_left = (outer, -half_tip)
-                            tip_right = (outer, half_tip)
-
-                            Line(root_left, tip_left)      # Left flank (straight)
-                            Line(tip_left, tip_right)      # Tip
-                            Line(tip_right, root_right)    # Right flank (straight)
-                            Line(root_right, root_left)    # Root (closes)
-
-                        elif self.profile == WormProfile.ZK or self.profile == "ZK":
-                            # ZK profile: Circular arc flanks per DIN 3975 Type K
-                            # Biconical grinding wheel profile - convex circular arc
-                            # Better for 3D printing and reduces stress concentrations
-
-                            # Generate circular arc flanks
-                            num_points = 9  # Points per flank for smooth arc
-                            left_flank = []
-                            right_flank = []
-
-                            # Arc radius typically 0.4-0.5 × module for biconical cutter
-                            arc_radius = 0.45 * self.params.module_mm
-
-                            # Calculate arc center position
-                            flank_height = outer - actual_inner
-                            flank_width_change = half_root - half_tip
-
-                            # Angle of straight flank for reference
-                            if flank_width_change > 0 and flank_height > 0:
-                                flank_angle = math.atan(flank_width_change / flank_height)
-                            else:
-                                flank_angle = 0
-
-                            # Generate arc points
-                            for j in range(num_points):
-                                t = j / (num_points - 1)
-                                r_pos = actual_inner + t * flank_height
-
-                                # Circular arc deviation from straight line
-                                linear_width = half_root + t * (half_tip - half_root)
-
-                                # Arc bulge (circular, not parabolic)
-                                arc_param = t * math.pi  # 0 to π
-                                arc_bulge = arc_radius * 0.15 * math.sin(arc_param)  # Circular arc approximation
-
-                                width = linear_width + arc_bulge
-                                left_flank.append((r_pos, -width))
-                                right_flank.append((r_pos, width))
-
-                            # Build profile with circular arc flanks
-                            Spline(left_flank)
-                            Line(left_flank[-1], right_flank[-1])  # Tip
-                            Spline(list(reversed(right_flank)))
-                            Line(right_flank[0], left_flank[0])    # Root (closes)
-
-                        elif self.profile == WormProfile.ZI or self.profile == "ZI":
-                            # ZI profile: Involute helicoid per DIN 3975 Type I
-                            # True involute tooth flanks for proper conjugate action
-
-                            # Calculate base circle radius
-                            pressure_angle_rad = math.radians(self.assembly_params.pressure_angle_deg)
-                            base_radius = pitch_radius * math.cos(pressure_angle_rad)
-
-                            # Generate involute flank points
-                            num_points = 11  # Points per flank for smooth curve
-                            left_flank = []
-                            right_flank = []
-
-                            # Involute function: inv(α) = tan(α) - α
-                            def involute(alpha):
-                                return math.tan(alpha) - alpha
-
-                            # Pressure angle at pitch circle
-                            inv_pitch = involute(pressure_angle_rad)
-
-                            # Half tooth thickness at pitch (in radians around the gear)
-                            tooth_thickness_rad = (half_root + half_tip) / pitch_radius
-
-                            # Minimum half width to prevent degenerate geometry
-                            min_half_width = 0.02 * m  # 2% of module
-
-                            # Track if involute is valid (no self-intersection)
-                            involute_valid = True
-
-                            for j in range(num_points):
-                                t = j / (num_points - 1)
-                                r_pos = actual_inner + t * (outer - actual_inner)
-
-                                # Actual radius from gear center
-                                r_actual = pitch_radius + r_pos
-
-                                # Straight flank width (fallback)
-                                half_width_straight = half_root + t * (half_tip - half_root)
-
-                                # Check if we're above base circle
-                                if r_actual > base_radius and involute_valid:
-                                    # Pressure angle at this radius
-                                    cos_alpha_r = base_radius / r_actual
-                                    # Clamp to valid range for acos
-                                    cos_alpha_r = max(-1.0, min(1.0, cos_alpha_r))
-                                    alpha_r = math.acos(cos_alpha_r)
-
-                                    # Involute deviation from radial line
-                                    inv_r = involute(alpha_r)
-
-                                    # Angular position of involute at this radius relative to pitch
-                                    # The involute curves away from the tooth centerline
-                                    delta_angle = inv_pitch - inv_r
-
-                                    # Convert to linear width at this radius
-                                    involute_offset = r_actual * delta_angle
-
-                                    # Apply involute curvature (flanks curve inward toward root)
-                                    half_width = half_width_straight - involute_offset
-
-                                    # Check for invalid geometry (negative or too small width)
-                                    if half_width < min_half_width:
-                                        # Involute causes self-intersection at small modules
-                                        # Fall back to straight flanks for remaining points
-                                        involute_valid = False
-                                        half_width = max(min_half_width, half_width_straight)
-                                else:
-                                    # Below base circle or invalid involute - use straight line
-                                    half_width = max(min_half_width, half_width_straight)
-
-                                left_flank.append((r_pos, -half_width))
-                                right_flank.append((r_pos, half_width))
-
-                            # Use Line instead of Spline if profile is nearly straight (small module)
-                            profile_height = outer - actual_inner
-                            if profile_height < 0.5 or not involute_valid:
-                                # Small profile or invalid involute - use lines for robustness
-                                Line(left_flank[0], left_flank[-1])
-                                Line(left_flank[-1], right_flank[-1])  # Tip
-                                Line(right_flank[-1], right_flank[0])
-                                Line(right_flank[0], left_flank[0])    # Root (closes)
-                            else:
-                                # Build profile with involute flanks
-                                Spline(left_flank)
-                                Line(left_flank[-1], right_flank[-1])  # Tip
-                                Spline(list(reversed(right_flank)))
-                                Line(right_flank[0], left_flank[0])    # Root (closes)
-
-                        else:
-                            raise ValueError(f"Unknown profile type: {self.profile}")
-                    make_face()
-
-                sections.append(sk.sketch.faces()[0])
-
-            # Loft the sections to create twisted tooth space
-            try:
-                space = loft(sections, ruled=True)
-                gear = gear - space
-            except Exception as e:
-                logger.warning(f"Tooth space {i} failed: {e}")
+        # Section Z positions, twist rotations and root depths are the same
+        # for every tooth
+        frames = _wheel_section_frames(
+            num_sections, cut_height, twist_degrees, inner, throat_distance, arc_radius
+        )
 
-        return gear
+        # Profile planes: origin at pitch radius, X = radial outward, Y = tangential.
+        # Built from plain tuples - wrapping each in a Vector first roughly
+        # doubles the cost of constructing the planes
+        profile_planes = []
+        # The tooth space profile only depends on the section's root depth,
+        # so compute each section's flanks once and reuse them for every tooth
+        section_flanks = []
+        for z_pos, cos_a, sin_a, actual_inner in frames.tolist():
+            profile_planes.append(Plane(
+                origin=(pitch_radius * cos_a, pitch_radius * sin_a, z_pos),
+                x_dir=(cos_a, sin_a, 0),
+                z_dir=(0, 0, 1),
+            ))
+            section_flanks.append(
+                self._tooth_space_flanks(actual_inner, outer, half_root, half_tip, pitch_radius)
+            )
+
+        # Create sections along Z for lofting
+        sections = []
+
+        for profile_plane, flanks in zip(profile_planes, section_flanks):
+            sections.append(profile_plane.location * _tooth_space_face(*flanks))
+
+        try:
+            return _cut_tooth_spaces(blank, sections, z)
+        except Exception as e:
+            logger.warning(f"Tooth spaces failed: {e}")
+
+        # Retry with the simplest tooth space that still twists: straight
+        # flanks lofted between the end sections only. Cheaper than making
+        # the user rebuild with different parameters, but the flanks are no
+        # longer the requested profile, so tell the caller
+        warnings.warn(
+            "Wheel tooth spaces failed; using straight two-section tooth spaces instead",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        simple_sections = []
+        for i in (0, -1):
+            left_flank, right_flank, _ = section_flanks[i]
+            simple_sections.append(
+                profile_planes[i].location * _tooth_space_face(left_flank, right_flank, False)
+            )
+        try:
+            return _cut_tooth_spaces(blank, simple_sections, z)
+        except Exception as e:
+            # All teeth share one lofted space, so none of them could be cut.
+            # A toothless blank must not be exported as a wheel
+            raise RuntimeError(f"Could not cut any of the {z} wheel tooth spaces: {e}") from e
+
+    def _tooth_space_flanks(
+        self,
+        inner: float,
+        outer: float,
+        half_root: float,
+        half_tip: float,
+        pitch_radius: float,
+    ) -> tuple[list, list, bool]:
+        """
+        Compute the flanks of one tooth space profile section.
+
+        Points are (radial, tangential) offsets from the pitch point in the
+        profile plane, running from root to tip.
+
+        Args:
+            inner: Radial offset of the profile root from the pitch radius
+            outer: Radial offset of the profile tip from the pitch radius
+            half_root: Half space width at the root
+            half_tip: Half space width at the tip
+            pitch_radius: Wheel pitch radius in mm
+
+        Returns:
+            Tuple of (left_flank, right_flank, smooth) where smooth means the
+            flanks are drawn as splines rather than straight lines
+        """
+        if self.profile == WormProfile.ZA or self.profile == "ZA":
+            # ZA profile: Straight flanks (trapezoidal) per DIN 3975
+            # Best for CNC machining - simple, accurate, standard
+            left_flank = [(inner, -half_root), (outer, -half_tip)]
+            right_flank = [(inner, half_root), (outer, half_tip)]
+            return left_flank, right_flank, False
+
+        if self.profile == WormProfile.ZK or self.profile == "ZK":
+            # ZK profile: Circular arc flanks per DIN 3975 Type K
+            # Biconical grinding wheel profile - convex circular arc
+            # Better for 3D printing and reduces stress concentrations
+
+            # Arc radius typically 0.4-0.5 × module for biconical cutter
+            flank_arc_radius = 0.45 * self.params.module_mm
+
+            # Generate circular arc flanks (9 points per flank)
+            flank = arc_flank_points(
+                inner,
+                outer,
+                half_root,
+                half_tip,
+                flank_arc_radius * 0.15,  # Circular arc approximation
+                9,
+            )
+            smooth = _flank_deviation(flank) >= self.spline_tolerance
+            return flank_tuples(flank, -1.0), flank_tuples(flank, 1.0), smooth
+
+        if self.profile == WormProfile.ZI or self.profile == "ZI":
+            # ZI profile: Involute helicoid per DIN 3975 Type I
+            # True involute tooth flanks for proper conjugate action
+
+            # Calculate base circle radius
+            pressure_angle_rad = math.radians(self.assembly_params.pressure_angle_deg)
+            base_radius = pitch_radius * math.cos(pressure_angle_rad)
+
+            # Generate involute flank points
+            num_points = 11  # Points per flank for smooth curve
+
+            # Minimum half width to prevent degenerate geometry
+            min_half_width = 0.02 * self.params.module_mm  # 2% of module
+
+            r_positions, half_widths, involute_valid = _involute_flank_half_widths(
+                inner,
+                outer,
+                pitch_radius,
+                base_radius,
+                pressure_angle_rad,
+                half_root,
+                half_tip,
+                min_half_width,
+                num_points,
+            )
+            flank = np.column_stack((r_positions, half_widths))
+
+            # Use lines instead of splines if the profile is nearly straight
+            # (small module) or the involute is invalid, for robustness
+            smooth = (
+                outer - inner >= 0.5
+                and involute_valid
+                and _flank_deviation(flank) >= self.spline_tolerance
+            )
+            return flank_tuples(flank, -1.0), flank_tuples(flank, 1.0), smooth
+
+        raise ValueError(f"Unknown profile type: {self.profile}")
+
+    def adopt_part(self, part: Part) -> None:
+        """Use a part built elsewhere (e.g. in a worker process) as this wheel's build result."""
+        self._part = part
+        self._part_key = self._cache_key()
+
+    def tessellate(self) -> Part:
+        """Build the wheel and mesh it once at linear_tol/angular_tol (see tessellation)."""
+        return tessellate_part(self.build(), self.linear_tol, self.angular_tol)
 
     def show(self):
         """Display the wheel in OCP viewer (requires ocp_vscode)."""
@@ -429,15 +676,34 @@ class WheelGeometry:
             pass  # No viewer available - silent fallback
         return wheel
 
-    def export_step(self, filepath: str):
-        """Export wheel to STEP file (builds if not already built)."""
-        if self._part is None:
-            self.build()
+    def export_step_bytes(self, write_pcurves: bool = True) -> bytes:
+        """Export wheel as STEP data in memory (builds if not already built).
 
-        if hasattr(self._part, 'export_step'):
-            self._part.export_step(filepath)
-        else:
-            from build123d import export_step as exp_step
-            exp_step(self._part, filepath)
+        The STEP writer streams straight into a buffer, so the data can be
+        written to disk in one go or served without a temporary file.
+
+        Args:
+            write_pcurves: Write parametric curves on surfaces. Disabling
+                roughly halves the file size; CAD/CAM importers rebuild them.
+
+        Returns:
+            STEP file contents
+        """
+        part = self.build()
+
+        from build123d import export_step as exp_step
+        buffer = io.BytesIO()
+        exp_step(part, buffer, write_pcurves=write_pcurves)
+        return buffer.getvalue()
+
+    def export_step(self, filepath: str, write_pcurves: bool = True):
+        """Export wheel to STEP file (builds if not already built).
+
+        Args:
+            filepath: Output STEP file path
+            write_pcurves: Write parametric curves on surfaces (see export_step_bytes)
+        """
+        step_data = self.export_step_bytes(write_pcurves=write_pcurves)
+        Path(filepath).write_bytes(step_data)
 
         logger.info(f"Exported wheel to {filepath}")
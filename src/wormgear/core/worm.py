@@ -4,10 +4,15 @@ Worm geometry generation using build123d.
 Creates CNC-ready worm geometry with helical threads.
 """
 
+import functools
+import io
 import logging
 import math
+from pathlib import Path
 from typing import Optional, Literal
 
+import numpy as np
+
 from OCP.ShapeFix import ShapeFix_Shape, ShapeFix_Solid
 from OCP.ShapeUpgrade import ShapeUpgrade_UnifySameDomain
 from OCP.BRepBuilderAPI import BRepBuilderAPI_Sewing, BRepBuilderAPI_MakeSolid
@@ -17,13 +22,16 @@ from OCP.TopoDS import TopoDS
 
 logger = logging.getLogger(__name__)
 from build123d import (
-    Part, Cylinder, Box, Align, Pos, Axis, Vector, Plane,
-    BuildSketch, BuildLine, Line, Spline, make_face, loft, Helix,
+    Part, Cylinder, Box, Align, Axis, Plane,
+    Edge, Wire, Face, loft,
     export_step, import_step,
 )
 from ..io.loaders import WormParams, AssemblyParams
 from ..enums import Hand, WormProfile
 from .features import BoreFeature, KeywayFeature, SetScrewFeature, add_bore_and_keyway
+from .build_cache import cached_build, geometry_cache_key
+from .flank_kernels import arc_flank_points, flank_tuples
+from .tessellation import tessellate_part
 
 # Profile types per DIN 3975
 # ZA: Straight flanks in axial section (Archimedean) - best for CNC machining
@@ -31,6 +39,201 @@ from .features import BoreFeature, KeywayFeature, SetScrewFeature, add_bore_and_
 # ZI: Involute helicoid (true involute in normal section) - NOT YET IMPLEMENTED
 ProfileType = Literal["ZA", "ZK", "ZI"]
 
+# Thread overrun past each end of the worm, in leads. The thread depth tapers
+# to nothing over this zone, which is trimmed off after the core union
+_THREAD_OVERRUN_LEADS = 0.5
+
+# numba is optional (not available in Pyodide) - without it the sampling
+# kernels below run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _thread_section_frames(
+    num_sections: int,
+    radius: float,
+    lead: float,
+    length: float,
+    start_angle_deg: float,
+    right_hand: bool,
+    taper_length: float,
+) -> np.ndarray:
+    """
+    Sample loft section frames along a thread helix.
+
+    Evaluates the helix analytically (centred on Z=0, starting at
+    start_angle_deg) rather than querying an OCCT edge for every section.
+
+    Args:
+        num_sections: Number of sections (>= 2), evenly spaced along the helix
+        radius: Helix radius in mm
+        lead: Axial advance per turn in mm
+        length: Axial length of the helix in mm
+        start_angle_deg: Angular position of the helix start
+        right_hand: True for right-hand (counter-clockwise rising) helix
+        taper_length: Length of the thread depth ramp at each end in mm
+
+    Returns:
+        Array of shape (num_sections, 7): point x, y, z, unit tangent x, y, z
+        and smoothed taper factor (0.05 to 1.0)
+    """
+    frames = np.empty((num_sections, 7))
+    direction = 1.0 if right_hand else -1.0
+    start = math.radians(start_angle_deg)
+    sweep = direction * 2.0 * math.pi * length / lead
+
+    # Tangent has constant horizontal and axial components along a helix
+    horizontal = 2.0 * math.pi * radius * length / lead
+    norm = math.sqrt(horizontal * horizontal + length * length)
+
+    t = np.linspace(0.0, 1.0, num_sections)
+    angle = start + sweep * t
+    cos_a = np.cos(angle)
+    sin_a = np.sin(angle)
+
+    frames[:, 0] = radius * cos_a
+    frames[:, 1] = radius * sin_a
+    frames[:, 2] = -length / 2 + t * length
+    frames[:, 3] = -direction * horizontal * sin_a / norm
+    frames[:, 4] = direction * horizontal * cos_a / norm
+    frames[:, 5] = length / norm
+
+    # Taper factor ramps from 0 to 1 over taper_length at each end
+    dist_from_start = t * length
+    dist_from_end = length - dist_from_start
+    taper_factor = np.where(
+        dist_from_start < taper_length,
+        dist_from_start / taper_length,
+        np.where(dist_from_end < taper_length, dist_from_end / taper_length, 1.0),
+    )
+
+    # Smooth with a cosine curve, keeping a minimum to avoid degenerate profiles
+    taper_factor = (1 - np.cos(taper_factor * math.pi)) / 2
+    frames[:, 6] = np.maximum(0.05, taper_factor)
+
+    return frames
+
+
+@njit(cache=True, fastmath=True)
+def _thread_section_profiles(
+    taper: np.ndarray,
+    addendum: float,
+    dedendum: float,
+    half_width_pitch: float,
+    pressure_angle_deg: float,
+) -> np.ndarray:
+    """
+    Size the thread profile at each loft section from its taper factor.
+
+    Args:
+        taper: Taper factor per section (from _thread_section_frames)
+        addendum: Full-depth addendum in mm
+        dedendum: Full-depth dedendum in mm
+        half_width_pitch: Half thread thickness at the pitch line in mm
+        pressure_angle_deg: Flank pressure angle in degrees
+
+    Returns:
+        Array of shape (len(taper), 4): inner and outer radial position
+        relative to the pitch radius, half width at the root and at the tip
+    """
+    # Thread is WIDER at root, NARROWER at tip due to pressure angle
+    tan_alpha = math.tan(math.radians(pressure_angle_deg))
+    half_root = half_width_pitch + dedendum * tan_alpha
+    half_tip = max(0.1, half_width_pitch - addendum * tan_alpha)
+
+    profiles = np.empty((taper.shape[0], 4))
+    # inner is negative (below pitch), outer is positive (above pitch)
+    profiles[:, 0] = -dedendum * taper
+    profiles[:, 1] = addendum * taper
+    # Minimum width avoids zero-width profiles in the taper
+    profiles[:, 2] = np.maximum(0.05, half_root * taper)
+    profiles[:, 3] = np.maximum(0.05, half_tip * taper)
+    return profiles
+
+
+def _straight_profile_face(inner_r, outer_r, half_root, half_tip, module) -> Face:
+    """
+    Build a straight-flanked (trapezoidal) thread profile face in the XY plane.
+
+    ZA profile per DIN 3975: straight flanks, best for CNC machining. Each
+    flank is a single line between its root and tip points.
+    """
+    return Face(Wire.make_polygon([
+        (inner_r, -half_root),  # Root left
+        (outer_r, -half_tip),   # Tip left (left flank is straight)
+        (outer_r, half_tip),    # Tip right
+        (inner_r, half_root),   # Root right (right flank is straight)
+    ], close=True))
+
+
+def _arc_profile_face(inner_r, outer_r, half_root, half_tip, module) -> Face:
+    """
+    Build a circular-arc flanked thread profile face in the XY plane.
+
+    ZK profile per DIN 3975 Type K: biconical grinding wheel profile with
+    convex circular arc flanks. Better for 3D printing and reduces stress
+    concentrations.
+    """
+    # Arc radius typically 0.4-0.5 × module for biconical cutter
+    arc_radius = 0.45 * module
+
+    # Generate circular arc flanks (9 points per flank)
+    flank = arc_flank_points(
+        inner_r,
+        outer_r,
+        half_root,
+        half_tip,
+        arc_radius * 0.15,  # Circular arc approximation
+        9,
+    )
+    left_flank = flank_tuples(flank, -1.0)
+    right_flank = flank_tuples(flank, 1.0)
+
+    # Build profile with circular arc flanks
+    return Face(Wire([
+        Edge.make_spline(left_flank),
+        Edge.make_line(left_flank[-1], right_flank[-1]),  # Tip
+        Edge.make_spline(list(reversed(right_flank))),
+        Edge.make_line(right_flank[0], left_flank[0]),    # Root (closes)
+    ]))
+
+
+# Thread profile faces by profile type, built in XY with
+# (inner_r, outer_r, half_root, half_tip, module) and then placed on each
+# section plane. Edges are made directly rather than through
+# BuildSketch/BuildLine, which is several times slower per section.
+#
+# ZI (involute helicoid, DIN 3975 Type I) does NOT mean curved flanks in the
+# axial cross-section: a worm acts like a helical rack, and a rack's
+# "involute" profile is a straight line at the pressure angle. The difference
+# from ZA is in the 3D helicoid surface, which comes from the helix sweep, so
+# ZI uses the straight profile too.
+_PROFILE_FACES = {
+    "ZA": _straight_profile_face,
+    "ZK": _arc_profile_face,
+    "ZI": _straight_profile_face,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _trim_box(width: float, length: float) -> Part:
+    """
+    Box keeping the slab |Z| <= length / 2 when intersected with the worm.
+
+    Cached so rebuilding a worm of the same size reuses one OCCT primitive.
+    The common returns a new shape, so the cached box is never modified.
+    """
+    return Box(
+        length=width,
+        width=width,
+        height=length,
+        align=(Align.CENTER, Align.CENTER, Align.CENTER)
+    )
+
 
 class WormGeometry:
     """
@@ -50,7 +253,10 @@ class WormGeometry:
         keyway: Optional[KeywayFeature] = None,
         ddcut: Optional['DDCutFeature'] = None,
         set_screw: Optional[SetScrewFeature] = None,
-        profile: ProfileType = "ZA"
+        profile: ProfileType = "ZA",
+        cache_dir: Optional[Path] = None,
+        linear_tol: float = 0.0005,
+        angular_tol: float = 0.05
     ):
         """
         Initialize worm geometry generator.
@@ -68,6 +274,11 @@ class WormGeometry:
                      "ZA" - Straight flanks (trapezoidal) - best for CNC (default)
                      "ZK" - Slightly convex flanks - better for 3D printing
                      "ZI" - Involute (straight in axial section) - for hobbing
+            cache_dir: Optional directory for caching built geometry between runs
+                       (see build_cache.DEFAULT_CACHE_DIR). Disabled by default.
+            linear_tol: Linear deflection for tessellation (STL/3MF export), relative
+                        to edge size as in build123d's mesh exporters (default: 0.0005)
+            angular_tol: Angular deflection for tessellation in radians (default: 0.05)
         """
         self.params = params
         self.assembly_params = assembly_params
@@ -78,13 +289,18 @@ class WormGeometry:
         self.ddcut = ddcut
         self.set_screw = set_screw
         self.profile = profile.upper() if isinstance(profile, str) else profile
+        self.cache_dir = cache_dir
+        self.linear_tol = linear_tol
+        self.angular_tol = angular_tol
 
         # Set keyway as shaft type if specified
         if self.keyway is not None:
             self.keyway.is_shaft = True
 
-        # Cache for built geometry (avoids rebuilding on export)
+        # Cache for built geometry (avoids rebuilding on export), tagged with
+        # the inputs it was built from so later parameter changes rebuild
         self._part = None
+        self._part_key = None
 
     def build(self) -> Part:
         """
@@ -93,10 +309,35 @@ class WormGeometry:
         Returns:
             build123d Part object ready for export
         """
-        # Return cached geometry if already built
-        if self._part is not None:
+        # Return cached geometry if already built from the current inputs
+        key = self._cache_key()
+        if self._part is not None and key == self._part_key:
             return self._part
 
+        if self.cache_dir is not None:
+            self._part = cached_build(key, self._build_worm, self.cache_dir)
+        else:
+            self._part = self._build_worm()
+        self._part_key = key
+        return self._part
+
+    def _cache_key(self) -> str:
+        """Key identifying this worm in the on-disk geometry cache."""
+        return geometry_cache_key(
+            "worm",
+            params=self.params,
+            assembly_params=self.assembly_params,
+            length=self.length,
+            sections_per_turn=self.sections_per_turn,
+            bore=self.bore,
+            keyway=self.keyway,
+            ddcut=self.ddcut,
+            set_screw=self.set_screw,
+            profile=self.profile,
+        )
+
+    def _build_worm(self) -> Part:
+        """Build the worm geometry from scratch."""
         root_radius = self.params.root_diameter_mm / 2
         tip_radius = self.params.tip_diameter_mm / 2
         lead = self.params.lead_mm
@@ -111,7 +352,7 @@ class WormGeometry:
 
         # Create core slightly longer than final worm to match extended threads
         # We'll trim to exact length after union
-        extended_length = self.length + 2 * lead  # Add lead on each end
+        extended_length = self.length + 2 * _THREAD_OVERRUN_LEADS * lead
         logger.info(f"Creating core cylinder (radius={root_radius:.2f}mm, height={extended_length:.2f}mm)...")
         core = Cylinder(
             radius=root_radius,
@@ -121,25 +362,15 @@ class WormGeometry:
 
         if threads is not None:
             logger.info("Unioning core with threads...")
-            # Use OCP fuse for reliable boolean union
-            from OCP.BRepAlgoAPI import BRepAlgoAPI_Fuse
-
+            # One multi-operand fuse: the core is the argument and every start
+            # is a tool, so the starts are never unioned pairwise. build123d
+            # builds the OCP operand lists, which differ between OCP releases
             try:
-                core_shape = core.wrapped if hasattr(core, 'wrapped') else core
-                threads_shape = threads.wrapped if hasattr(threads, 'wrapped') else threads
-
-                fuse_op = BRepAlgoAPI_Fuse(core_shape, threads_shape)
-                fuse_op.Build()
-
-                if fuse_op.IsDone():
-                    worm = Part(fuse_op.Shape())
-                    logger.debug("OCP union complete")
-                else:
-                    logger.warning("OCP union failed, using build123d operator")
-                    worm = core + threads
+                worm = Part(core.fuse(*threads).wrapped)
+                logger.debug("Core/thread union complete")
             except Exception as e:
-                logger.warning(f"OCP union error ({e}), using build123d operator")
-                worm = core + threads
+                logger.warning(f"Core/thread union error ({e}), using pairwise union")
+                worm = self._union_pairwise(core, threads)
         else:
             logger.info("No threads to union - using core only")
             worm = core
@@ -152,50 +383,24 @@ class WormGeometry:
         half_length = self.length / 2
         logger.info(f"Cutting at Z = ±{half_length:.2f}mm...")
 
-        from OCP.BRepAlgoAPI import BRepAlgoAPI_Cut
+        from OCP.BRepAlgoAPI import BRepAlgoAPI_Common
 
         try:
             worm_shape = worm.wrapped if hasattr(worm, 'wrapped') else worm
 
-            # Create top cutting box (remove everything above +half_length)
-            top_cut_box = Box(
-                length=trim_diameter,
-                width=trim_diameter,
-                height=extended_length,
-                align=(Align.CENTER, Align.CENTER, Align.MIN)
-            )
-            # Move box to start at Z = +half_length
-            top_cut_box = Pos(0, 0, half_length) * top_cut_box
-
-            # Cut away top part
-            cut_top = BRepAlgoAPI_Cut(worm_shape, top_cut_box.wrapped)
-            cut_top.Build()
-
-            if cut_top.IsDone():
-                worm_shape = cut_top.Shape()
-                logger.debug("Top cut successful")
-            else:
-                logger.warning("Top cut failed")
-
-            # Create bottom cutting box (remove everything below -half_length)
-            bottom_cut_box = Box(
-                length=trim_diameter,
-                width=trim_diameter,
-                height=extended_length,
-                align=(Align.CENTER, Align.CENTER, Align.MAX)
-            )
-            # Move box to end at Z = -half_length
-            bottom_cut_box = Pos(0, 0, -half_length) * bottom_cut_box
+            # Keep only the slab between Z = -half_length and +half_length.
+            # One common with a box of the final length trims both ends in a
+            # single Boolean instead of two separate end cuts
+            keep_box = _trim_box(trim_diameter, self.length)
 
-            # Cut away bottom part
-            cut_bottom = BRepAlgoAPI_Cut(worm_shape, bottom_cut_box.wrapped)
-            cut_bottom.Build()
+            trim_op = BRepAlgoAPI_Common(worm_shape, keep_box.wrapped)
+            trim_op.Build()
 
-            if cut_bottom.IsDone():
-                worm = Part(cut_bottom.Shape())
-                logger.debug("Bottom cut successful")
+            if trim_op.IsDone():
+                worm = Part(trim_op.Shape())
+                logger.debug("Trim successful")
             else:
-                logger.warning("Bottom cut failed")
+                logger.warning("Trim failed")
                 worm = Part(worm_shape)
 
         except Exception as e:
@@ -229,8 +434,6 @@ class WormGeometry:
             )
 
         logger.debug(f"Final worm volume: {worm.volume:.2f} mm³")
-        # Cache the built geometry
-        self._part = worm
         return worm
 
     def _repair_geometry(self, part: Part) -> Part:
@@ -341,25 +544,29 @@ class WormGeometry:
             logger.debug(f"Geometry repair skipped: {e}")
             return part
 
-    def _create_threads(self) -> Part:
-        """Create helical thread(s) to add to the core."""
-        threads = []
-
-        for start_index in range(self.params.num_starts):
-            angle_offset = (360 / self.params.num_starts) * start_index
-            thread = self._create_single_thread(angle_offset)
-            if thread is not None:
-                threads.append(thread)
+    def _create_threads(self) -> Optional[list]:
+        """
+        Create the helical thread for each start, to be fused with the core.
 
-        if len(threads) == 0:
+        Starts differ only by their angle about the worm axis, so one thread
+        is lofted and the others are rotated copies of it (a location change,
+        no new geometry). The threads are not unioned with each other; the
+        core fuse joins them all in one Boolean.
+        """
+        thread = self._create_single_thread()
+        if thread is None:
             return None
-        elif len(threads) == 1:
-            return threads[0]
-        else:
-            result = threads[0]
-            for thread in threads[1:]:
-                result = result + thread
-            return result
+
+        num_starts = self.params.num_starts
+        return [thread.rotate(Axis.Z, (360 / num_starts) * i) for i in range(num_starts)]
+
+    @staticmethod
+    def _union_pairwise(core: Part, threads: list) -> Part:
+        """Fallback union of the core and each thread with the build123d operator."""
+        worm = core
+        for thread in threads:
+            worm = worm + thread
+        return worm
 
     def _create_single_thread(self, start_angle: float = 0) -> Part:
         """
@@ -368,8 +575,6 @@ class WormGeometry:
         Uses the worm axis as an auxiliary spine to control profile orientation,
         ensuring the profile stays aligned with the radial direction as it sweeps.
         """
-        import math
-
         pitch_radius = self.params.pitch_diameter_mm / 2
         tip_radius = self.params.tip_diameter_mm / 2
         root_radius = self.params.root_diameter_mm / 2
@@ -377,46 +582,9 @@ class WormGeometry:
         is_right_hand = self.params.hand == Hand.RIGHT
         logger.debug(f"Thread: pitch_r={pitch_radius:.2f}, tip_r={tip_radius:.2f}, root_r={root_radius:.2f}, lead={lead:.2f}mm")
 
-        # Thread profile dimensions
-        pressure_angle_rad = math.radians(self.assembly_params.pressure_angle_deg)
-
-        # Thread width at pitch circle (axial measurement)
-        thread_half_width_pitch = self.params.thread_thickness_mm / 2
-
-        # Thread is WIDER at root, NARROWER at tip due to pressure angle
-        addendum = self.params.addendum_mm
-        dedendum = self.params.dedendum_mm
-        thread_half_width_root = thread_half_width_pitch + dedendum * math.tan(pressure_angle_rad)
-        thread_half_width_tip = max(0.1, thread_half_width_pitch - addendum * math.tan(pressure_angle_rad))
-
-        # Extend thread length beyond worm length so we can trim to exact length
-        extended_length = self.length + 2 * lead  # Add lead on each end
-
-        # Build helix with extended length
-        helix_height = extended_length
-        num_turns = extended_length / lead  # Exact number of turns for extended length
-
-        # Create helix path at pitch radius
-        # For left-hand worms, use negative pitch to reverse rotation direction
-        # (not negative Z direction, which would shift the helix out of range)
-        helix = Helix(
-            pitch=lead if is_right_hand else -lead,
-            height=helix_height,
-            radius=pitch_radius,
-            center=(0, 0, -helix_height / 2),
-            direction=(0, 0, 1)
-        )
-
-        if start_angle != 0:
-            helix = helix.rotate(Axis.Z, start_angle)
-
-        # Get addendum and dedendum for tapering
-        addendum = self.params.addendum_mm
-        dedendum = self.params.dedendum_mm
-
         # Extend thread length beyond worm length so we can trim to exact length
-        # This removes the fragile tapered ends
-        extended_length = self.length + 2 * lead  # Add lead on each end
+        overrun = _THREAD_OVERRUN_LEADS * lead
+        extended_length = self.length + 2 * overrun
 
         # Create profiles along the helix for lofting
         # Use extended length for sections calculation
@@ -425,160 +593,50 @@ class WormGeometry:
         num_sections = max(2, num_sections)
         sections = []
 
-        # Thread end taper: ramp down thread depth over ~1 lead at each end
+        # Resolve the profile builder once rather than per section
+        profile_key = self.profile.value if isinstance(self.profile, WormProfile) else self.profile
+        profile_face = _PROFILE_FACES.get(profile_key)
+        if profile_face is None:
+            raise ValueError(f"Unknown profile type: {self.profile}")
+
+        # Sample the helix at pitch radius (points, tangents and end taper) in one pass
+        # Thread end taper: ramp down thread depth over the overrun at each end
         # These tapered ends will be trimmed off, but they ensure smooth geometry
-        taper_length = lead  # Taper zone length at each end
-
-        for i in range(num_sections):
-            t = i / (num_sections - 1)
-            point = helix @ t
-            tangent = helix % t
-
-            # Calculate taper factor for smooth thread ends
-            # Ramps from 0 to 1 over taper_length at each end
-            # Use parameter t along helix (0 to 1) instead of z_position
-            # This works correctly for both left and right hand worms
-            dist_along_helix = t * extended_length
-            dist_from_start = dist_along_helix
-            dist_from_end = extended_length - dist_along_helix
-
-            if dist_from_start < taper_length:
-                # Taper at start end
-                taper_factor = dist_from_start / taper_length
-            elif dist_from_end < taper_length:
-                # Taper at end
-                taper_factor = dist_from_end / taper_length
-            else:
-                # Full depth in middle
-                taper_factor = 1.0
-
-            # Smooth the taper with a cosine curve for better appearance
-            taper_factor = (1 - math.cos(taper_factor * math.pi)) / 2
-
-            # Ensure minimum taper factor to avoid degenerate profiles
-            taper_factor = max(0.05, taper_factor)
-
-            # Apply taper to addendum/dedendum
-            local_addendum = addendum * taper_factor
-            local_dedendum = dedendum * taper_factor
-
-            # Calculate local tip and root radii
-            local_tip_radius = pitch_radius + local_addendum
-            local_root_radius = pitch_radius - local_dedendum
-
-            # Validate profile is meaningful (avoid degenerate profiles)
-            profile_height = local_addendum + local_dedendum
-            if profile_height < 0.1:  # Less than 0.1mm - skip degenerate section
-                continue
-
-            # Profile coordinates relative to pitch radius
-            # inner_r is negative (below pitch), outer_r is positive (above pitch)
-            inner_r = -local_dedendum
-            outer_r = local_addendum
-
-            # Apply taper to thread width with minimum to avoid zero-width profiles
-            local_thread_half_width_root = max(0.05, thread_half_width_root * taper_factor)
-            local_thread_half_width_tip = max(0.05, thread_half_width_tip * taper_factor)
-
-            # Radial direction at this point
-            angle = math.atan2(point.Y, point.X)
-            radial_dir = Vector(math.cos(angle), math.sin(angle), 0)
-
-            # Profile plane perpendicular to helix tangent
-            profile_plane = Plane(origin=point, x_dir=radial_dir, z_dir=tangent)
-
-            with BuildSketch(profile_plane) as sk:
-                with BuildLine():
-                    if self.profile == WormProfile.ZA or self.profile == "ZA":
-                        # ZA profile: Straight flanks (trapezoidal) per DIN 3975
-                        # Best for CNC machining - simple, accurate, standard
-                        root_left = (inner_r, -local_thread_half_width_root)
-                        root_right = (inner_r, local_thread_half_width_root)
-                        tip_left = (outer_r, -local_thread_half_width_tip)
-                        tip_right = (outer_r, local_thread_half_width_tip)
-
-                        Line(root_left, tip_left)      # Left flank (straight)
-                        Line(tip_left, tip_right)      # Tip
-                        Line(tip_right, root_right)    # Right flank (straight)
-                        Line(root_right, root_left)    # Root (closes)
-
-                    elif self.profile == WormProfile.ZK or self.profile == "ZK":
-                        # ZK profile: Circular arc flanks per DIN 3975 Type K
-                        # Biconical grinding wheel profile - convex circular arc
-                        # Better for 3D printing and reduces stress concentrations
-
-                        # Generate circular arc flanks
-                        num_points = 9  # Points per flank for smooth arc
-                        left_flank = []
-                        right_flank = []
-
-                        # Arc radius typically 0.4-0.5 × module for biconical cutter
-                        arc_radius = 0.45 * self.params.module_mm
-
-                        # Calculate arc center position
-                        # Arc should be tangent at approximately pitch radius
-                        flank_height = outer_r - inner_r
-                        flank_width_change = local_thread_half_width_root - local_thread_half_width_tip
-
-                        # Angle of straight flank for reference
-                        if flank_width_change > 0:
-                            flank_angle = math.atan(flank_width_change / flank_height)
-                        else:
-                            flank_angle = 0
-
-                        # Generate arc points
-                        for j in range(num_points):
-                            t = j / (num_points - 1)
-                            r_pos = inner_r + t * flank_height
-
-                            # Circular arc deviation from straight line
-                            linear_width = local_thread_half_width_root + t * (local_thread_half_width_tip - local_thread_half_width_root)
-
-                            # Arc bulge (circular, not parabolic)
-                            # Maximum at mid-flank
-                            arc_param = t * math.pi  # 0 to π
-                            arc_bulge = arc_radius * 0.15 * math.sin(arc_param)  # Circular arc approximation
-
-                            width = linear_width + arc_bulge
-                            left_flank.append((r_pos, -width))
-                            right_flank.append((r_pos, width))
-
-                        # Build profile with circular arc flanks
-                        Spline(left_flank)
-                        Line(left_flank[-1], right_flank[-1])  # Tip
-                        Spline(list(reversed(right_flank)))
-                        Line(right_flank[0], left_flank[0])    # Root (closes)
-
-                    elif self.profile == WormProfile.ZI or self.profile == "ZI":
-                        # ZI profile: Involute helicoid per DIN 3975 Type I
-                        #
-                        # IMPORTANT: For worms, ZI does NOT mean curved flanks in the
-                        # axial cross-section! A worm acts like a helical rack, and a
-                        # rack's "involute" profile is a STRAIGHT LINE at the pressure angle.
-                        #
-                        # The difference between ZA and ZI for worms is in the 3D helicoid
-                        # surface geometry, not the 2D cross-section shape. Both have
-                        # straight flanks in the axial section.
-                        #
-                        # Therefore, ZI for worms = ZA (straight trapezoidal profile)
-                        # The involute helicoid property is achieved through the helix
-                        # sweep, not through curved cross-section flanks.
-
-                        root_left = (inner_r, -local_thread_half_width_root)
-                        root_right = (inner_r, local_thread_half_width_root)
-                        tip_left = (outer_r, -local_thread_half_width_tip)
-                        tip_right = (outer_r, local_thread_half_width_tip)
-
-                        Line(root_left, tip_left)      # Left flank (straight)
-                        Line(tip_left, tip_right)      # Tip
-                        Line(tip_right, root_right)    # Right flank (straight)
-                        Line(root_right, root_left)    # Root (closes)
-
-                    else:
-                        raise ValueError(f"Unknown profile type: {self.profile}")
-                make_face()
-
-            sections.append(sk.sketch.faces()[0])
+        frames = _thread_section_frames(
+            num_sections,
+            pitch_radius,
+            lead,
+            extended_length,
+            float(start_angle),
+            is_right_hand,
+            overrun,  # Taper zone length at each end
+        )
+
+        profiles = _thread_section_profiles(
+            np.ascontiguousarray(frames[:, 6]),
+            self.params.addendum_mm,
+            self.params.dedendum_mm,
+            self.params.thread_thickness_mm / 2,
+            self.assembly_params.pressure_angle_deg,
+        )
+
+        # Skip degenerate sections (profile height under 0.1mm) in the taper
+        keep = profiles[:, 1] - profiles[:, 0] >= 0.1
+        module = self.params.module_mm
+
+        for (x, y, z, tx, ty, tz, _), (inner_r, outer_r, half_root, half_tip) in zip(
+            frames[keep].tolist(), profiles[keep].tolist()
+        ):
+            # Profile plane perpendicular to helix tangent, x along the radial
+            # direction (the section point lies on the pitch circle)
+            profile_plane = Plane(
+                origin=(x, y, z),
+                x_dir=(x / pitch_radius, y / pitch_radius, 0),
+                z_dir=(tx, ty, tz),
+            )
+
+            profile = profile_face(inner_r, outer_r, half_root, half_tip, module)
+            sections.append(profile_plane.location * profile)
 
         # Loft with ruled=True for consistent geometry
         logger.debug(f"Lofting {len(sections)} sections...")
@@ -587,6 +645,15 @@ class WormGeometry:
 
         return thread
 
+    def adopt_part(self, part: Part) -> None:
+        """Use a part built elsewhere (e.g. in a worker process) as this worm's build result."""
+        self._part = part
+        self._part_key = self._cache_key()
+
+    def tessellate(self) -> Part:
+        """Build the worm and mesh it once at linear_tol/angular_tol (see tessellation)."""
+        return tessellate_part(self.build(), self.linear_tol, self.angular_tol)
+
     def show(self):
         """Display the worm in OCP viewer (requires ocp_vscode)."""
         worm = self.build()
@@ -597,16 +664,35 @@ class WormGeometry:
             pass  # No viewer available - silent fallback
         return worm
 
-    def export_step(self, filepath: str):
-        """Export worm to STEP file (builds if not already built)."""
-        if self._part is None:
-            self.build()
+    def export_step_bytes(self, write_pcurves: bool = True) -> bytes:
+        """Export worm as STEP data in memory (builds if not already built).
 
+        The STEP writer streams straight into a buffer, so the data can be
+        written to disk in one go or served without a temporary file.
+
+        Args:
+            write_pcurves: Write parametric curves on surfaces. Disabling
+                roughly halves the file size; CAD/CAM importers rebuild them.
+
+        Returns:
+            STEP file contents
+        """
+        part = self.build()
+
+        from build123d import export_step as exp_step
+        buffer = io.BytesIO()
+        exp_step(part, buffer, write_pcurves=write_pcurves)
+        return buffer.getvalue()
+
+    def export_step(self, filepath: str, write_pcurves: bool = True):
+        """Export worm to STEP file (builds if not already built).
+
+        Args:
+            filepath: Output STEP file path
+            write_pcurves: Write parametric curves on surfaces (see export_step_bytes)
+        """
+        step_data = self.export_step_bytes(write_pcurves=write_pcurves)
         logger.info(f"Exporting worm: volume={self._part.volume:.2f} mm³")
-        if hasattr(self._part, 'export_step'):
-            self._part.export_step(filepath)
-        else:
-            from build123d import export_step as exp_step
-            exp_step(self._part, filepath)
+        Path(filepath).write_bytes(step_data)
 
         logger.info(f"Exported worm to {filepath}")
@@ -7,7 +7,9 @@ Supports schema v1.0 with separate features section.
 Uses Pydantic V2 for automatic validation and enum coercion.
 """
 
+import functools
 import json
+from collections import OrderedDict
 from math import pi
 from pathlib import Path
 from typing import Optional, Union, Dict, Any
@@ -16,6 +18,14 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 
 from ..enums import Hand, WormType, WormProfile, BoreType, AntiRotation
 
+# orjson is optional - stdlib json.loads accepts bytes too, so either
+# parser can be fed the raw file contents directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class SetScrewSpec(BaseModel):
     """Set screw specification."""
@@ -431,36 +441,33 @@ class ManufacturingFeatures(BaseModel):
     bolt_diameter: Optional[float] = None
 
 
-def load_design_json(filepath: Union[str, Path]) -> WormGearDesign:
-    """
-    Load worm gear design from calculator JSON export.
+# Designs written by save_design_json() in this process, keyed by resolved
+# path -> (mtime_ns, size, design), for trusted loads of the same file.
+# Bounded like the load cache: the least recently saved paths are dropped
+_SAVED_DESIGNS_MAX = 64
+_saved_designs: OrderedDict[str, tuple] = OrderedDict()
 
-    Uses Pydantic for automatic validation and enum coercion.
-
-    Args:
-        filepath: Path to JSON file from wormgearcalc
+# Top-level sections every design file must have
+_REQUIRED_SECTIONS = frozenset(('worm', 'wheel', 'assembly'))
 
-    Returns:
-        WormGearDesign with all parameters
 
-    Raises:
-        FileNotFoundError: If file doesn't exist
-        ValidationError: If JSON is invalid or missing required fields
+@functools.lru_cache(maxsize=64)
+def _load_design_cached(path: str, mtime_ns: int, size: int) -> WormGearDesign:
     """
-    filepath = Path(filepath)
-
-    if not filepath.exists():
-        raise FileNotFoundError(f"Design file not found: {filepath}")
+    Parse and validate a design file, memoized on its identity.
 
-    with open(filepath, 'r') as f:
-        data = json.load(f)
+    mtime_ns and size are part of the cache key so an edited file is
+    re-read; they are not otherwise used. Callers must not mutate the
+    returned model - load_design_json() hands out deep copies.
+    """
+    data = _json_loads(Path(path).read_bytes())
 
     # Check for 'design' wrapper (some exports have this)
-    if 'design' in data:
+    if isinstance(data, dict) and 'design' in data:
         data = data['design']
 
-    # Validate required sections
-    if 'worm' not in data or 'wheel' not in data or 'assembly' not in data:
+    # Validate required sections (field-level checks are left to Pydantic)
+    if not isinstance(data, dict) or not _REQUIRED_SECTIONS <= data.keys():
         raise ValueError(
             "Invalid design JSON - must contain 'worm', 'wheel', and 'assembly' sections"
         )
@@ -477,6 +484,45 @@ def load_design_json(filepath: Union[str, Path]) -> WormGearDesign:
     return WormGearDesign.model_validate(data)
 
 
+def load_design_json(filepath: Union[str, Path], trusted: bool = False) -> WormGearDesign:
+    """
+    Load worm gear design from calculator JSON export.
+
+    Uses Pydantic for automatic validation and enum coercion. Parsed designs
+    are cached by (path, mtime, size), so repeated loads of an unchanged file
+    skip JSON parsing and validation. Each call returns an independent copy.
+
+    Args:
+        filepath: Path to JSON file from wormgearcalc
+        trusted: If the file is unchanged since save_design_json() wrote it
+            in this process, return a copy of the saved (already validated)
+            design instead of parsing and validating the file
+
+    Returns:
+        WormGearDesign with all parameters
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValidationError: If JSON is invalid or missing required fields
+    """
+    filepath = Path(filepath)
+
+    # stat() both checks existence and provides the cache key
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Design file not found: {filepath}") from None
+
+    path = str(filepath.resolve())
+    if trusted:
+        saved = _saved_designs.get(path)
+        if saved is not None and saved[:2] == (stat.st_mtime_ns, stat.st_size):
+            return saved[2].model_copy(deep=True)
+
+    design = _load_design_cached(path, stat.st_mtime_ns, stat.st_size)
+    return design.model_copy(deep=True)
+
+
 def save_design_json(design: WormGearDesign, filepath: Union[str, Path]) -> None:
     """
     Save complete worm gear design to JSON file using schema v1.0 format.
@@ -487,24 +533,20 @@ def save_design_json(design: WormGearDesign, filepath: Union[str, Path]) -> None
     """
     filepath = Path(filepath)
 
-    # Convert to dict, handling enums
-    data = design.model_dump(exclude_none=True)
+    # Convert to dict, with enums as their values for JSON
+    data = design.model_dump(mode='json', exclude_none=True)
 
     # Add schema version
     data['schema_version'] = '2.0'
 
-    # Convert enums to their values for JSON
-    def convert_enums(obj):
-        if isinstance(obj, dict):
-            return {k: convert_enums(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_enums(v) for v in obj]
-        elif hasattr(obj, 'value'):  # Enum
-            return obj.value
-        return obj
-
-    data = convert_enums(data)
-
     # Write JSON with nice formatting
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
+
+    # Remember the design for trusted loads of this exact file
+    stat = filepath.stat()
+    path = str(filepath.resolve())
+    _saved_designs[path] = (stat.st_mtime_ns, stat.st_size, design.model_copy(deep=True))
+    _saved_designs.move_to_end(path)
+    while len(_saved_designs) > _SAVED_DESIGNS_MAX:
+        _saved_designs.popitem(last=False)
@@ -3,6 +3,7 @@ Tests for the command-line interface.
 """
 
 import json
+import os
 import subprocess
 import sys
 import pytest
@@ -121,6 +122,103 @@ class TestCLIGeneration:
         assert len(step_files) == 1
         assert "worm" in step_files[0].name.lower()
 
+    def test_cli_skips_up_to_date_step(self, temp_json_file, tmp_path):
+        """Test up-to-date STEP files are not re-exported without --force."""
+        output_dir = tmp_path / "output"
+        args = [
+            sys.executable, "-m", "wormgear.cli.generate",
+            str(temp_json_file),
+            "-o", str(output_dir),
+            "--worm-only",
+            "--worm-length", "10",
+            "--sections", "12"
+        ]
+        # Export fingerprints live in the user cache - keep them in tmp_path
+        env = {**os.environ, "HOME": str(tmp_path / "home")}
+
+        def saved_step_files(stdout):
+            return [
+                line for line in stdout.splitlines()
+                if "Saved:" in line and line.endswith(".step")
+            ]
+
+        first = subprocess.run(args, capture_output=True, text=True, timeout=120, env=env)
+        assert first.returncode == 0
+        assert len(saved_step_files(first.stdout)) == 1
+
+        # Only the STEP file is written to the output directory
+        assert [p.suffix for p in output_dir.iterdir()] == [".step"]
+
+        second = subprocess.run(args, capture_output=True, text=True, timeout=120, env=env)
+        assert second.returncode == 0
+        assert "Up-to-date" in second.stdout
+        assert saved_step_files(second.stdout) == []
+
+        forced = subprocess.run(
+            args + ["--force"], capture_output=True, text=True, timeout=120, env=env
+        )
+        assert forced.returncode == 0
+        assert len(saved_step_files(forced.stdout)) == 1
+
+        # A different geometry option on the unchanged design re-exports
+        step_file = next(output_dir.glob("*.step"))
+        before_ns = step_file.stat().st_mtime_ns
+        changed = subprocess.run(
+            args + ["--sections", "8"], capture_output=True, text=True, timeout=120, env=env
+        )
+        assert changed.returncode == 0
+        assert "Up-to-date" not in changed.stdout
+        assert len(saved_step_files(changed.stdout)) == 1
+        assert step_file.stat().st_mtime_ns > before_ns
+
+    def test_cli_quiet(self, temp_json_file, tmp_path):
+        """Test --quiet suppresses progress output but still writes files."""
+        output_dir = tmp_path / "output"
+
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "wormgear.cli.generate",
+                str(temp_json_file),
+                "-o", str(output_dir),
+                "--worm-only",
+                "--worm-length", "10",
+                "--sections", "12",
+                "--quiet"
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120
+        )
+
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert len(list(output_dir.glob("*.step"))) == 1
+
+    def test_cli_quiet_still_reports_warnings(self, temp_json_file, tmp_path):
+        """Test --quiet keeps user-facing warnings (printed to stderr)."""
+        output_dir = tmp_path / "output"
+
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "wormgear.cli.generate",
+                str(temp_json_file),
+                "-o", str(output_dir),
+                "--worm-only",
+                "--worm-length", "10",
+                "--sections", "12",
+                "--set-screw",
+                "--set-screw-size", "X3",
+                "--quiet"
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120
+        )
+
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert "Invalid set screw size 'X3'" in result.stderr
+
     def test_cli_wheel_only(self, temp_json_file, tmp_path):
         """Test generating only the wheel."""
         output_dir = tmp_path / "output"
@@ -258,12 +356,13 @@ class TestCLIOutput:
         assert "Pressure angle" in result.stdout
 
     def test_cli_volume_reported(self, temp_json_file):
-        """Test that volumes are reported."""
+        """Test that volumes are reported with --verbose."""
         result = subprocess.run(
             [
                 sys.executable, "-m", "wormgear.cli.generate",
                 str(temp_json_file),
                 "--no-save",
+                "--verbose",
                 "--worm-length", "10",
                 "--sections", "12"
             ],
@@ -514,4 +613,79 @@ class TestCLIInterferenceCheck:
         assert result.returncode == 0
         assert "Checking interference" in result.stdout
         # Virtual hobbing should also pass (better mesh)
-        assert "No interference detected" in result.stdout
\ No newline at end of file
+        assert "No interference detected" in result.stdout
+
+
+class FailingGeometry:
+    """Geometry stub whose build always fails (picklable, so it runs in a worker)."""
+
+    builds = 0
+
+    def build(self):
+        type(self).builds += 1
+        raise RuntimeError("no tooth space could be cut")
+
+
+class SlowGeometry:
+    """Geometry stub that takes a long time to build (runs in a worker)."""
+
+    def build(self):
+        import time
+        from build123d import Box
+
+        time.sleep(10)
+        return Box(1, 1, 1)
+
+
+class TestCLIParallelBuild:
+    """Test the worker-pool build and its in-process fallback."""
+
+    def test_worker_failure_rebuilt_in_process(self, capsys):
+        """A part that cannot be built in a worker is rebuilt in-process."""
+        import threading
+        from build123d import Box
+        from wormgear.cli.generate import _build_parts
+
+        class LockedGeometry:
+            """Geometry stub holding a lock, so it cannot be sent to a worker."""
+
+            def __init__(self, size):
+                self.size = size
+                self.lock = threading.Lock()
+
+            def build(self):
+                return Box(self.size, self.size, self.size)
+
+        pending = {"worm": LockedGeometry(2), "wheel": LockedGeometry(3)}
+        parts, exported = _build_parts(pending, jobs=2)
+
+        out = capsys.readouterr().out
+        assert "Worm cannot be sent to a worker" in out
+        assert "Wheel cannot be sent to a worker" in out
+        assert parts["worm"].volume == pytest.approx(8)
+        assert parts["wheel"].volume == pytest.approx(27)
+        assert exported == set()
+
+    def test_worker_geometry_error_not_rebuilt(self, capsys):
+        """A geometry error raised in a worker is reported, not rebuilt in-process."""
+        from wormgear.cli.generate import _build_parts
+
+        pending = {"worm": FailingGeometry(), "wheel": FailingGeometry()}
+        with pytest.raises(RuntimeError, match="no tooth space"):
+            _build_parts(pending, jobs=2)
+
+        # Builds ran only in the workers, never in this process
+        assert FailingGeometry.builds == 0
+        assert "building in-process" not in capsys.readouterr().out
+
+    def test_worker_geometry_error_does_not_wait(self):
+        """A worker build error is raised without waiting for the other part."""
+        import time
+        from wormgear.cli.generate import _build_parts
+
+        pending = {"worm": SlowGeometry(), "wheel": FailingGeometry()}
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="no tooth space"):
+            _build_parts(pending, jobs=2)
+
+        assert time.monotonic() - start < 5
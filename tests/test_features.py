@@ -3,6 +3,7 @@ Tests for bore and keyway features.
 """
 
 import math
+import sys
 import pytest
 
 from wormgear import (
@@ -11,9 +12,9 @@ from wormgear import (
     BoreFeature, KeywayFeature, DDCutFeature,
     get_din_6885_keyway, calculate_default_bore, calculate_default_ddcut,
 )
-from wormgear.core.features import SetScrewFeature, HubFeature, get_set_screw_size
+from wormgear.core.features import SetScrewFeature, HubFeature, get_set_screw_size, SET_SCREW_SIZES
 from wormgear.core.features import (
-    create_bore, create_keyway, create_ddcut,
+    create_bore, create_keyway, create_ddcut, create_set_screw,
     add_bore_and_keyway, DIN_6885_KEYWAYS,
 )
 from build123d import Cylinder, Axis, Align
@@ -143,6 +144,22 @@ class TestDIN6885Lookup:
         assert get_din_6885_keyway(5.0) is None
         assert get_din_6885_keyway(100.0) is None
 
+    def test_batch_matches_scalar(self):
+        """Test the vectorized lookup agrees with get_din_6885_keyway."""
+        import numpy as np
+        from wormgear.core.features import get_din_6885_keyway_batch
+
+        bores = np.arange(0.0, 100.0, 0.25)
+        rows = get_din_6885_keyway_batch(bores)
+
+        assert rows.shape == (len(bores), 4)
+        for bore, row in zip(bores, rows):
+            expected = get_din_6885_keyway(float(bore))
+            if expected is None:
+                assert np.isnan(row).all()
+            else:
+                assert tuple(row) == expected
+
 
 class TestCalculateDefaultBore:
     """Tests for calculate_default_bore function."""
@@ -238,6 +255,30 @@ class TestCalculateDefaultBore:
         assert bore == 2.0
         assert warning is True  # Thin rim warning
 
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_batch_matches_scalar(self, use_numba, monkeypatch):
+        """Test the vectorized version agrees with calculate_default_bore."""
+        import numpy as np
+        from wormgear.core.bore_sizing import calculate_default_bore_batch
+
+        if use_numba:
+            pytest.importorskip("numba")
+        else:
+            # Blocking the kernel module forces the pure NumPy path
+            monkeypatch.setitem(sys.modules, "wormgear.core.bore_kernels", None)
+
+        pitch = np.linspace(0.0, 120.0, 97)
+        pitch_grid, root_grid = np.meshgrid(pitch, pitch - 5.0)
+        bores, warnings = calculate_default_bore_batch(pitch_grid.ravel(), root_grid.ravel())
+
+        for p, r, bore, warning in zip(pitch_grid.ravel(), root_grid.ravel(), bores, warnings):
+            expected_bore, expected_warning = calculate_default_bore(float(p), float(r))
+            if expected_bore is None:
+                assert np.isnan(bore)
+            else:
+                assert bore == expected_bore
+            assert warning == expected_warning
+
 
 class TestDDCutFeature:
     """Tests for DDCutFeature dataclass."""
@@ -1060,6 +1101,27 @@ class TestSetScrewFeature:
         assert size == "M6"
         assert diameter == 6.0
 
+    def test_set_screw_hole_reused_unchanged(self):
+        """Test that the cached screw hole is shared and never moved by cuts."""
+        from wormgear.core.features import _set_screw_hole
+
+        bore = BoreFeature(diameter=8.0)
+        part = create_bore(Cylinder(radius=15, height=10), bore, part_length=10)
+        # Same radius and length as create_set_screw uses for this bore
+        radius = get_set_screw_size(bore.diameter)[1] / 2
+        length = bore.diameter / 2 + 10.0
+        hole = _set_screw_hole(radius, length, Axis.Z)
+        position = hole.location.position
+        hits = _set_screw_hole.cache_info().hits
+
+        first = create_set_screw(part, bore, SetScrewFeature(count=2), part_length=10)
+        second = create_set_screw(part, bore, SetScrewFeature(count=2), part_length=10)
+
+        assert _set_screw_hole.cache_info().hits == hits + 2
+        assert _set_screw_hole(radius, length, Axis.Z) is hole
+        assert hole.location.position == position
+        assert abs(first.volume - second.volume) < 1e-6
+
 
 class TestHubFeature:
     """Tests for HubFeature dataclass (P1.4)."""
@@ -1172,3 +1234,11 @@ class TestGetSetScrewSize:
         size, diameter = get_set_screw_size(50.0)
         assert size in ["M6", "M8"]
         assert 6.0 <= diameter <= 8.0
+
+    def test_matches_size_table(self):
+        """Test lookups agree with SET_SCREW_SIZES at and just below every boundary."""
+        for (min_d, max_d), expected in SET_SCREW_SIZES.items():
+            assert get_set_screw_size(min_d) == expected
+            assert get_set_screw_size((min_d + max_d) / 2) == expected
+            assert get_set_screw_size(max_d - 0.01) == expected
+        assert get_set_screw_size(150.0) == ("M8", 8.0)
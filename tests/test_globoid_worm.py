@@ -127,6 +127,33 @@ class TestGloboidWormGeometry:
         assert hasattr(globoid, 'volume')
         assert globoid.volume > 0
 
+    def test_globoid_tessellate_stl_export(
+        self, worm_params, assembly_params, wheel_pitch_diameter, tmp_path
+    ):
+        """Test the tessellate() + STL export path used by the web generator."""
+        from build123d import export_stl
+
+        globoid_geo = GloboidWormGeometry(
+            params=worm_params,
+            assembly_params=assembly_params,
+            wheel_pitch_diameter=wheel_pitch_diameter,
+            length=10.0,
+            sections_per_turn=12,
+            linear_tol=0.01,
+            angular_tol=0.2
+        )
+        globoid = globoid_geo.tessellate()
+
+        assert globoid is globoid_geo.tessellate()
+        output_file = tmp_path / "globoid.stl"
+        export_stl(
+            globoid,
+            str(output_file),
+            tolerance=globoid_geo.linear_tol,
+            angular_tolerance=globoid_geo.angular_tol
+        )
+        assert output_file.stat().st_size > 1000
+
     def test_globoid_volume_reasonable(self, worm_params, assembly_params, wheel_pitch_diameter):
         """Test that globoid volume is within reasonable bounds."""
         length = 10.0
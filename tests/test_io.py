@@ -108,6 +108,15 @@ class TestLoadDesignJson:
         with pytest.raises(json.JSONDecodeError):
             load_design_json(invalid_file)
 
+    @pytest.mark.parametrize("content", ["[1, 2, 3]", "42", '"worm wheel assembly"'])
+    def test_load_non_object_json(self, tmp_path, content):
+        """Test that a JSON top level that is not an object raises ValueError."""
+        json_file = tmp_path / "not_object.json"
+        json_file.write_text(content)
+
+        with pytest.raises(ValueError, match="must contain"):
+            load_design_json(json_file)
+
     def test_load_missing_required_field(self, tmp_path, sample_design_7mm):
         """Test that missing required fields raise an error."""
         from pydantic import ValidationError
@@ -138,6 +147,25 @@ class TestLoadDesignJson:
         assert design.worm.profile_shift == 0.0
         assert design.wheel.profile_shift == 0.0
 
+    def test_repeated_load_returns_independent_copies(self, temp_json_file):
+        """Test that cached loads don't share mutable state between callers."""
+        first = load_design_json(temp_json_file)
+        first.worm.module_mm = 99.0
+
+        second = load_design_json(temp_json_file)
+        assert second is not first
+        assert second.worm.module_mm == 0.5
+
+    def test_load_picks_up_file_changes(self, tmp_path, sample_design_7mm):
+        """Test that editing a design file invalidates the cached parse."""
+        json_file = tmp_path / "test.json"
+        json_file.write_text(json.dumps(sample_design_7mm))
+        assert load_design_json(json_file).wheel.num_teeth == 12
+
+        sample_design_7mm["wheel"]["num_teeth"] = 120
+        json_file.write_text(json.dumps(sample_design_7mm, indent=2))
+        assert load_design_json(json_file).wheel.num_teeth == 120
+
     def test_load_examples_7mm(self, examples_dir):
         """Test loading the actual 7mm.json example file."""
         example_file = examples_dir / "7mm.json"
@@ -311,6 +339,42 @@ class TestProfileJsonSerialization:
         assert loaded.manufacturing is not None
         assert loaded.manufacturing.profile == WormProfile.ZK
 
+    def test_trusted_load_returns_saved_design(self, tmp_path, base_design):
+        """Trusted load of a just-saved file returns an independent copy of the design."""
+        json_file = tmp_path / "trusted.json"
+        save_design_json(base_design, json_file)
+
+        loaded = load_design_json(json_file, trusted=True)
+        assert loaded == base_design
+        assert loaded is not base_design
+
+        # Edits after saving are not reflected in the trusted copy
+        base_design.worm.num_starts = 4
+        assert load_design_json(json_file, trusted=True).worm.num_starts != 4
+
+    def test_trusted_load_rereads_modified_file(self, tmp_path, base_design):
+        """Trusted load falls back to parsing when the file changed since saving."""
+        json_file = tmp_path / "trusted.json"
+        save_design_json(base_design, json_file)
+
+        data = json.loads(json_file.read_text())
+        data["worm"]["num_starts"] = 3
+        json_file.write_text(json.dumps(data))
+
+        assert load_design_json(json_file, trusted=True).worm.num_starts == 3
+
+    def test_saved_designs_bounded(self, tmp_path, base_design):
+        """Only the most recently saved designs are kept for trusted loads."""
+        from wormgear.io import loaders
+
+        for i in range(loaders._SAVED_DESIGNS_MAX + 5):
+            save_design_json(base_design, tmp_path / f"design_{i}.json")
+
+        assert len(loaders._saved_designs) == loaders._SAVED_DESIGNS_MAX
+        assert str((tmp_path / "design_0.json").resolve()) not in loaders._saved_designs
+        last = tmp_path / f"design_{loaders._SAVED_DESIGNS_MAX + 4}.json"
+        assert str(last.resolve()) in loaders._saved_designs
+
     def test_profile_in_saved_json_content(self, tmp_path, base_design):
         """Test that profile field appears correctly in saved JSON."""
         base_design.manufacturing = ManufacturingParams(profile="ZK")
@@ -52,6 +52,9 @@ GENERATOR_FILES = CALCULATOR_FILES + [
     "core/features.py",
     "core/globoid_worm.py",
     "core/virtual_hobbing.py",
+    "core/build_cache.py",
+    "core/flank_kernels.py",
+    "core/tessellation.py",
 ]
 
 
@@ -164,6 +167,15 @@ class TestCalculatorEnvironment:
         assert isinstance(diameter, float)
         assert isinstance(has_warning, bool)
 
+    def test_core_star_import_without_geometry(self, calculator_env):
+        """Verify 'import *' from core does not touch the geometry modules."""
+        namespace = {}
+        exec("from wormgear.core import *", namespace)
+
+        assert callable(namespace["calculate_default_bore"])
+        assert "WormGeometry" not in namespace
+        assert "wormgear.core.worm" not in sys.modules
+
 
 @pytest.mark.slow
 class TestGeneratorEnvironment:
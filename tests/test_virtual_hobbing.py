@@ -106,6 +106,33 @@ class TestVirtualHobbingWheelGeometry:
         assert hasattr(wheel, 'volume')
         assert wheel.volume > 0
 
+    def test_virtual_hobbing_tessellate_stl_export(
+        self, wheel_params, worm_params, assembly_params, tmp_path
+    ):
+        """Test the tessellate() + STL export path used by the web generator."""
+        from build123d import export_stl
+
+        wheel_geo = VirtualHobbingWheelGeometry(
+            params=wheel_params,
+            worm_params=worm_params,
+            assembly_params=assembly_params,
+            face_width=4.0,
+            hobbing_steps=18,  # Reduced for speed
+            linear_tol=0.01,
+            angular_tol=0.2
+        )
+        wheel = wheel_geo.tessellate()
+
+        assert wheel is wheel_geo.build()
+        output_file = tmp_path / "wheel.stl"
+        export_stl(
+            wheel,
+            str(output_file),
+            tolerance=wheel_geo.linear_tol,
+            angular_tolerance=wheel_geo.angular_tol
+        )
+        assert output_file.stat().st_size > 1000
+
     def test_virtual_hobbing_volume_reasonable(self, wheel_params, worm_params, assembly_params):
         """Test that virtual hobbing wheel volume is within reasonable bounds."""
         face_width = 4.0
@@ -128,6 +155,38 @@ class TestVirtualHobbingWheelGeometry:
         assert wheel.volume > min_volume
         assert wheel.volume < max_volume
 
+    def test_incremental_hobbing_matches_rotating_wheel(
+        self, wheel_params, worm_params, assembly_params
+    ):
+        """Test cutting with the hob moved into the wheel's frame matches rotating the wheel."""
+        from build123d import Pos, Rot
+
+        steps = 12  # Reduced for speed
+        wheel_geo = VirtualHobbingWheelGeometry(
+            params=wheel_params,
+            worm_params=worm_params,
+            assembly_params=assembly_params,
+            face_width=4.0,
+            hobbing_steps=steps
+        )
+        blank = wheel_geo._create_blank()
+        hob = wheel_geo._create_hob()
+        wheel = wheel_geo._simulate_hobbing_incremental(blank, hob)
+
+        # Reference: rotate the wheel to each step, cut, and rotate it back
+        ratio = wheel_params.num_teeth / worm_params.num_starts
+        centre_distance = assembly_params.centre_distance_mm
+        reference = blank
+        for step in range(steps):
+            wheel_angle = step * 360.0 / steps
+            hob_positioned = (
+                Pos(centre_distance, 0, 0) * Rot(X=90) * Rot(Z=wheel_angle * ratio) * hob
+            )
+            reference = Rot(Z=-wheel_angle) * ((Rot(Z=wheel_angle) * reference) - hob_positioned)
+
+        assert wheel.volume < blank.volume
+        assert wheel.volume == pytest.approx(reference.volume, rel=1e-3)
+
     def test_virtual_hobbing_is_watertight(self, wheel_params, worm_params, assembly_params):
         """Test that virtual hobbing wheel geometry is watertight."""
         wheel_geo = VirtualHobbingWheelGeometry(
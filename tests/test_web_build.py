@@ -5,6 +5,8 @@ These tests ensure the web interface has all necessary files for
 WASM geometry generation in the browser.
 """
 
+import os
+import re
 import subprocess
 import json
 from pathlib import Path
@@ -19,6 +21,9 @@ SRC_DIR = REPO_ROOT / "src" / "wormgear"
 EXAMPLES_DIR = REPO_ROOT / "examples"
 DIST_DIR = REPO_ROOT / "dist"  # Build output directory
 
+# Pyodide CDN version in script URLs (e.g., pyodide/v0.29.0/)
+PYODIDE_VERSION_RE = re.compile(r'pyodide/v([0-9.]+)/')
+
 
 # List of all files that MUST be present after build for WASM to work
 REQUIRED_WASM_FILES = [
@@ -33,6 +38,9 @@ REQUIRED_WASM_FILES = [
     "wormgear/core/globoid_worm.py",
     "wormgear/core/virtual_hobbing.py",
     "wormgear/core/bore_sizing.py",
+    "wormgear/core/build_cache.py",
+    "wormgear/core/flank_kernels.py",
+    "wormgear/core/tessellation.py",
     # IO
     "wormgear/io/__init__.py",
     "wormgear/io/loaders.py",
@@ -48,29 +56,34 @@ REQUIRED_WASM_FILES = [
 ]
 
 
+@pytest.fixture(scope="module")
+def web_build():
+    """Run the build script once and share the result across this module."""
+    return subprocess.run(
+        [str(BUILD_SCRIPT)],
+        cwd=WEB_DIR,
+        capture_output=True,
+        text=True
+    )
+
+
 def test_build_script_exists():
     """Build script should exist and be executable."""
     assert BUILD_SCRIPT.exists(), f"Build script not found at {BUILD_SCRIPT}"
     assert BUILD_SCRIPT.stat().st_mode & 0o111, "Build script is not executable"
 
 
-def test_build_script_runs_successfully():
+def test_build_script_runs_successfully(web_build):
     """Build script should run without errors."""
-    result = subprocess.run(
-        [str(BUILD_SCRIPT)],
-        cwd=WEB_DIR,
-        capture_output=True,
-        text=True
-    )
+    result = web_build
 
     assert result.returncode == 0, f"Build script failed:\n{result.stderr}"
     assert "✅ Build complete!" in result.stdout, "Build didn't complete successfully"
 
 
-def test_all_required_files_copied():
+def test_all_required_files_copied(web_build):
     """All required Python files should be copied to dist/wormgear/."""
-    # Run build first
-    subprocess.run([str(BUILD_SCRIPT)], cwd=WEB_DIR, check=True, capture_output=True)
+    assert web_build.returncode == 0, f"Build script failed:\n{web_build.stderr}"
 
     for required_file in REQUIRED_WASM_FILES:
         file_path = DIST_DIR / required_file
@@ -96,26 +109,29 @@ def test_app_lazy_js_has_all_files():
         )
 
 
-def test_no_pycache_in_output():
-    """Build should not include __pycache__ directories."""
-    # Run build first
-    subprocess.run([str(BUILD_SCRIPT)], cwd=WEB_DIR, check=True, capture_output=True)
+@pytest.fixture(scope="module")
+def dist_bytecode(web_build):
+    """Walk the built package once, collecting __pycache__ dirs and .pyc files."""
+    assert web_build.returncode == 0, f"Build script failed:\n{web_build.stderr}"
 
-    dist_wormgear = DIST_DIR / "wormgear"
-    if dist_wormgear.exists():
-        pycache_dirs = list(dist_wormgear.rglob("__pycache__"))
-        assert len(pycache_dirs) == 0, f"Found {len(pycache_dirs)} __pycache__ directories in output"
+    pycache_dirs = []
+    pyc_files = []
+    for root, dirs, files in os.walk(DIST_DIR / "wormgear"):
+        pycache_dirs.extend(os.path.join(root, d) for d in dirs if d == "__pycache__")
+        pyc_files.extend(os.path.join(root, f) for f in files if f.endswith(".pyc"))
+    return pycache_dirs, pyc_files
 
 
-def test_no_pyc_files_in_output():
-    """Build should not include .pyc files."""
-    # Run build first
-    subprocess.run([str(BUILD_SCRIPT)], cwd=WEB_DIR, check=True, capture_output=True)
+def test_no_pycache_in_output(dist_bytecode):
+    """Build should not include __pycache__ directories."""
+    pycache_dirs, _ = dist_bytecode
+    assert len(pycache_dirs) == 0, f"Found {len(pycache_dirs)} __pycache__ directories in output"
 
-    dist_wormgear = DIST_DIR / "wormgear"
-    if dist_wormgear.exists():
-        pyc_files = list(dist_wormgear.rglob("*.pyc"))
-        assert len(pyc_files) == 0, f"Found {len(pyc_files)} .pyc files in output"
+
+def test_no_pyc_files_in_output(dist_bytecode):
+    """Build should not include .pyc files."""
+    _, pyc_files = dist_bytecode
+    assert len(pyc_files) == 0, f"Found {len(pyc_files)} .pyc files in output"
 
 
 def test_source_files_exist():
@@ -230,9 +246,8 @@ def test_pyodide_version_consistency():
         js_file = "app.js"
 
     # Extract version from HTML (e.g., v0.29.0)
-    import re
-    html_match = re.search(r'pyodide/v([0-9.]+)/', html_content)
-    js_matches = re.findall(r'pyodide/v([0-9.]+)/', js_content)
+    html_match = PYODIDE_VERSION_RE.search(html_content)
+    js_matches = PYODIDE_VERSION_RE.findall(js_content)
 
     assert html_match, "Pyodide version not found in index.html"
     assert js_matches, f"Pyodide version not found in {js_file}"
@@ -261,7 +276,6 @@ def test_json_field_names_match_dataclass_params():
     loaders_content = loaders_file.read_text()
 
     # Extract field names from class definitions using regex
-    import re
 
     def extract_model_fields(content: str, class_name: str) -> set:
         """Extract field names from a dataclass or Pydantic BaseModel definition."""
@@ -391,7 +405,6 @@ def test_pyodide_init_loads_all_calculator_files():
     This test catches cases where a new .py file is added to the calculator
     but not included in the file list in pyodide-init.js.
     """
-    import re
 
     # Get all Python files in calculator directory
     calculator_dir = SRC_DIR / "calculator"
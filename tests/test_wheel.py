@@ -255,6 +255,141 @@ class TestWheelGeometry:
         assert wheel.volume > 0
         assert wheel.is_valid
 
+    def test_wheel_build_cache(self, wheel_params, worm_params, assembly_params, tmp_path):
+        """Test that a wheel built with cache_dir is reused by a later build."""
+        def make_geo(face_width):
+            return WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=face_width,
+                cache_dir=tmp_path
+            )
+
+        wheel = make_geo(4.0).build()
+        assert len(list(tmp_path.glob("*.brep"))) == 1
+
+        cached = make_geo(4.0).build()
+        assert abs(cached.volume - wheel.volume) < 1e-6
+
+        # Different parameters get their own cache entry
+        make_geo(5.0).build()
+        assert len(list(tmp_path.glob("*.brep"))) == 2
+
+    def test_wheel_build_memoized_until_inputs_change(
+        self, wheel_params, worm_params, assembly_params
+    ):
+        """Test that build() reuses the part until a build input changes."""
+        wheel_geo = WheelGeometry(
+            params=wheel_params,
+            worm_params=worm_params,
+            assembly_params=assembly_params,
+            face_width=4.0
+        )
+        wheel = wheel_geo.build()
+        assert wheel_geo.build() is wheel
+
+        wheel_geo.face_width = 5.0
+        wider = wheel_geo.build()
+        assert wider is not wheel
+        assert wider.volume > wheel.volume
+        assert wheel_geo.build() is wider
+
+    def test_tooth_space_dimensions_cached(self):
+        """Test that tooth space dimensions are reused across rebuilds."""
+        from wormgear.core.wheel import _tooth_space_dimensions
+
+        args = (4.0, 0.5, 15.0, 13.75, 14.5, 20.0, 5.0, 0.0)
+        dims = _tooth_space_dimensions(*args)
+        hits = _tooth_space_dimensions.cache_info().hits
+
+        assert _tooth_space_dimensions(*args) is dims
+        assert _tooth_space_dimensions.cache_info().hits == hits + 1
+
+        tip_radius, root_radius, pitch_radius, twist_degrees, half_root, half_tip = dims
+        assert (tip_radius, root_radius, pitch_radius) == (7.5, 6.875, 7.25)
+        assert 0 < half_root < half_tip
+        assert twist_degrees > 0
+
+    def test_wheel_blank_reused_unchanged(self, wheel_params, worm_params, assembly_params):
+        """Test that the cached blank is shared between builds and never cut."""
+        from wormgear.core.wheel import _wheel_blank
+
+        blank = _wheel_blank(wheel_params.tip_diameter_mm / 2, 4.0)
+        volume = blank.volume
+
+        def build():
+            return WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=4.0
+            ).build()
+
+        first = build()
+        second = build()
+
+        assert _wheel_blank(wheel_params.tip_diameter_mm / 2, 4.0) is blank
+        assert abs(blank.volume - volume) < 1e-6
+        assert abs(first.volume - second.volume) < 1e-6
+
+    def test_wheel_tooth_space_fallback(
+        self, wheel_params, worm_params, assembly_params, monkeypatch
+    ):
+        """Test that a failed loft retries with simple tooth spaces, then raises."""
+        import wormgear.core.wheel as wheel_module
+
+        real_loft = wheel_module.loft
+
+        def build():
+            return WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=4.0,
+                chord_tol=0.001
+            ).build()
+
+        # Multi-section loft fails, the two-section retry succeeds
+        def flaky_loft(sections, ruled=False):
+            if len(sections) > 2:
+                raise ValueError("loft failed")
+            return real_loft(sections, ruled=ruled)
+
+        monkeypatch.setattr(wheel_module, "loft", flaky_loft)
+        with pytest.warns(RuntimeWarning, match="two-section"):
+            wheel = build()
+        tip_radius = wheel_params.tip_diameter_mm / 2
+        assert wheel.volume < math.pi * tip_radius**2 * 4.0 * 0.95
+
+        # Both attempts fail: no toothless blank is returned
+        def failing_loft(sections, ruled=False):
+            raise ValueError("loft failed")
+
+        monkeypatch.setattr(wheel_module, "loft", failing_loft)
+        with pytest.warns(RuntimeWarning), pytest.raises(RuntimeError, match="tooth spaces"):
+            build()
+
+    def test_wheel_chord_tol_fidelity(self, wheel_params, worm_params, assembly_params):
+        """Test that the default loft section count matches a finely sampled wheel."""
+        def build(chord_tol):
+            return WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=4.0,
+                chord_tol=chord_tol
+            ).build()
+
+        wheel = build(0.03)
+        fine = build(0.001)
+
+        assert wheel.is_valid
+        assert abs(wheel.volume - fine.volume) < 5e-3 * fine.volume
+        # Same tip and face extents
+        assert abs(wheel.bounding_box().size.X - fine.bounding_box().size.X) < 0.01
+        assert abs(wheel.bounding_box().size.Z - fine.bounding_box().size.Z) < 0.01
+
 
 class TestThroatedWheel:
     """Tests for throated (hobbed) wheel functionality."""
@@ -510,6 +645,27 @@ class TestWheelProfileTypes:
         assert wheel_za.is_valid
         assert wheel_zk.is_valid
 
+    def test_wheel_zk_spline_tolerance(self, wheel_params, worm_params, assembly_params):
+        """Test that ZK flanks within spline_tolerance are drawn straight like ZA."""
+        def build(profile, spline_tolerance):
+            return WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=4.0,
+                profile=profile,
+                spline_tolerance=spline_tolerance
+            ).build()
+
+        wheel_za = build("ZA", 1e-3)
+        wheel_zk_straight = build("ZK", 10.0)
+        wheel_zk_curved = build("ZK", 0.0)
+
+        assert wheel_zk_straight.is_valid
+        assert abs(wheel_zk_straight.volume - wheel_za.volume) < 1e-3
+        # Convex flanks make the tooth spaces wider
+        assert wheel_zk_curved.volume < wheel_za.volume
+
     def test_wheel_profile_with_throating(self, wheel_params, worm_params, assembly_params):
         """Test that profile works with throated wheel."""
         for profile in ["ZA", "ZK"]:
@@ -526,6 +682,27 @@ class TestWheelProfileTypes:
             assert wheel.volume > 0
             assert wheel.is_valid
 
+    def test_throated_zk_follows_worm_surface(self, wheel_params, worm_params, assembly_params):
+        """Test that throated ZK tooth spaces use the same throat as ZA.
+
+        The ZK flank arc radius must not replace the worm throat radius -
+        sections near the mid-plane would otherwise get inverted profiles.
+        """
+        wheels = {
+            profile: WheelGeometry(
+                params=wheel_params,
+                worm_params=worm_params,
+                assembly_params=assembly_params,
+                face_width=2.0,
+                throated=True,
+                profile=profile
+            ).build()
+            for profile in ["ZA", "ZK"]
+        }
+
+        assert len(wheels["ZK"].faces()) == len(wheels["ZA"].faces())
+        assert abs(wheels["ZK"].volume - wheels["ZA"].volume) < 0.05 * wheels["ZA"].volume
+
 
 class TestWheelFromJsonFile:
     """Tests using actual JSON files."""
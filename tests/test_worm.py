@@ -154,6 +154,68 @@ class TestWormGeometry:
         assert worm is not None
         assert worm.volume > 0
 
+    @pytest.fixture
+    def two_start_params(self):
+        """Two-start worm parameters (m=2)."""
+        return WormParams(
+            module_mm=2.0,
+            num_starts=2,
+            pitch_diameter_mm=20.0,
+            tip_diameter_mm=24.0,
+            root_diameter_mm=15.0,
+            lead_mm=12.566,
+            axial_pitch_mm=2.0 * math.pi,
+            lead_angle_deg=17.66,
+            addendum_mm=2.0,
+            dedendum_mm=2.5,
+            thread_thickness_mm=2.74,
+            hand="right",
+            profile_shift=0.0
+        )
+
+    def test_worm_multiple_starts_single_fuse(self, two_start_params, assembly_params, caplog):
+        """Test that a multi-start worm fuses into one valid solid without the fallback."""
+        worm = WormGeometry(
+            params=two_start_params,
+            assembly_params=assembly_params,
+            length=30.0,
+            sections_per_turn=12
+        ).build()
+
+        assert "pairwise union" not in caplog.text
+        assert worm.is_valid
+        assert len(worm.solids()) == 1
+        # Threads add material beyond the root cylinder
+        assert worm.volume > math.pi * 7.5**2 * 30.0
+
+    def test_worm_union_fallback(self, two_start_params, assembly_params, caplog, monkeypatch):
+        """Test that a failed multi-operand fuse falls back to the pairwise union."""
+        from build123d import Shape
+
+        def build():
+            return WormGeometry(
+                params=two_start_params,
+                assembly_params=assembly_params,
+                length=30.0,
+                sections_per_turn=12
+            ).build()
+
+        expected = build().volume
+
+        real_fuse = Shape.fuse
+
+        def single_operand_fuse(self, *to_fuse, **kwargs):
+            if len(to_fuse) > 1:
+                raise RuntimeError("multi-operand fuse failed")
+            return real_fuse(self, *to_fuse, **kwargs)
+
+        monkeypatch.setattr(Shape, "fuse", single_operand_fuse)
+        worm = build()
+
+        assert "pairwise union" in caplog.text
+        assert worm.is_valid
+        assert abs(worm.volume - expected) < expected * 1e-3
+
     def test_worm_left_hand(self, sample_design_left_hand):
         """Test left-hand worm generation."""
         module_mm = sample_design_left_hand["worm"]["module_mm"]
@@ -241,6 +303,84 @@ class TestWormGeometry:
         assert abs(y_extent - tip_diameter) < 1.0
         assert abs(z_extent - length) < 1.0
 
+    def test_worm_export_step_bytes(self, worm_params, assembly_params, tmp_path):
+        """Test in-memory STEP export matches the file export."""
+        worm_geo = WormGeometry(
+            params=worm_params,
+            assembly_params=assembly_params,
+            length=10.0,
+            sections_per_turn=12
+        )
+
+        step_data = worm_geo.export_step_bytes()
+        assert step_data.startswith(b"ISO-10303-21")
+
+        # Dropping p-curves gives a smaller file
+        compact_data = worm_geo.export_step_bytes(write_pcurves=False)
+        assert compact_data.startswith(b"ISO-10303-21")
+        assert len(compact_data) < len(step_data)
+
+        output_file = tmp_path / "worm.step"
+        worm_geo.export_step(str(output_file))
+        assert output_file.stat().st_size > 1000
+
+    def test_worm_tessellate(self, worm_params, assembly_params):
+        """Test that tessellate() meshes every face of the built worm."""
+        from OCP.BRep import BRep_Tool
+        from OCP.TopLoc import TopLoc_Location
+
+        worm_geo = WormGeometry(
+            params=worm_params,
+            assembly_params=assembly_params,
+            length=10.0,
+            sections_per_turn=12,
+            linear_tol=0.01,
+            angular_tol=0.2
+        )
+        worm = worm_geo.tessellate()
+
+        assert worm is worm_geo.build()
+        for face in worm.faces():
+            assert BRep_Tool.Triangulation_s(face.wrapped, TopLoc_Location()) is not None
+
+    def test_worm_build_cache(self, worm_params, assembly_params, tmp_path):
+        """Test that a worm built with cache_dir is reused by a later build."""
+        def make_geo(length):
+            return WormGeometry(
+                params=worm_params,
+                assembly_params=assembly_params,
+                length=length,
+                sections_per_turn=12,
+                cache_dir=tmp_path
+            )
+
+        worm = make_geo(10.0).build()
+        assert len(list(tmp_path.glob("*.brep"))) == 1
+
+        cached = make_geo(10.0).build()
+        assert abs(cached.volume - worm.volume) < 1e-6
+
+        # Different parameters get their own cache entry
+        make_geo(12.0).build()
+        assert len(list(tmp_path.glob("*.brep"))) == 2
+
+    def test_worm_build_memoized_until_inputs_change(self, worm_params, assembly_params):
+        """Test that build() reuses the part until a build input changes."""
+        worm_geo = WormGeometry(
+            params=worm_params,
+            assembly_params=assembly_params,
+            length=10.0,
+            sections_per_turn=12
+        )
+        worm = worm_geo.build()
+        assert worm_geo.build() is worm
+
+        worm_geo.length = 12.0
+        longer = worm_geo.build()
+        assert longer is not worm
+        assert longer.volume > worm.volume
+        assert worm_geo.build() is longer
+
 
 class TestWormProfileTypes:
     """Tests for DIN 3975 profile types (ZA/ZK)."""
@@ -159,6 +159,9 @@ if '/home/pyodide' not in sys.path:
         { path: 'wormgear/core/globoid_worm.py', pyPath: '/home/pyodide/wormgear/core/globoid_worm.py' },
         { path: 'wormgear/core/virtual_hobbing.py', pyPath: '/home/pyodide/wormgear/core/virtual_hobbing.py' },
         { path: 'wormgear/core/bore_sizing.py', pyPath: '/home/pyodide/wormgear/core/bore_sizing.py' },
+        { path: 'wormgear/core/build_cache.py', pyPath: '/home/pyodide/wormgear/core/build_cache.py' },
+        { path: 'wormgear/core/flank_kernels.py', pyPath: '/home/pyodide/wormgear/core/flank_kernels.py' },
+        { path: 'wormgear/core/tessellation.py', pyPath: '/home/pyodide/wormgear/core/tessellation.py' },
         { path: 'wormgear/io/__init__.py', pyPath: '/home/pyodide/wormgear/io/__init__.py' },
         { path: 'wormgear/io/loaders.py', pyPath: '/home/pyodide/wormgear/io/loaders.py' },
         { path: 'wormgear/io/schema.py', pyPath: '/home/pyodide/wormgear/io/schema.py' },
@@ -433,14 +436,15 @@ if generate_type in ['worm', 'both']:
             with tempfile.NamedTemporaryFile(mode='w', suffix='.3mf', delete=False) as tmp:
                 temp_3mf_path = tmp.name
 
-            # Use build123d Mesher for 3MF export with finer mesh settings
-            # Lower deflection values = finer mesh, may help avoid duplicate vertex issues
+            # Mesh once at the geometry's tessellation tolerances (finer than
+            # the build123d defaults); 3MF and STL export reuse the triangulation
+            worm = worm_geo.tessellate()
             from build123d import Mesher, Unit
             mesher = Mesher(unit=Unit.MM)
             mesher.add_shape(
                 worm,
-                linear_deflection=0.0005,   # Finer than default 0.001
-                angular_deflection=0.05     # Finer than default 0.1
+                linear_deflection=worm_geo.linear_tol,
+                angular_deflection=worm_geo.angular_tol
             )
             mesher.write(temp_3mf_path)
 
@@ -459,17 +463,17 @@ if generate_type in ['worm', 'both']:
             worm_3mf_b64 = None
 
         # Also export STL for compatibility
-        # Use finer mesh settings consistent with 3MF export for better detail
+        # Same tolerances as the 3MF export, so the existing mesh is reused
         print("  Exporting to STL format...")
         with tempfile.NamedTemporaryFile(mode='w', suffix='.stl', delete=False) as tmp:
             temp_stl_path = tmp.name
 
         from build123d import export_stl
         export_stl(
-            worm,
+            worm_geo.tessellate(),
             temp_stl_path,
-            tolerance=0.0005,       # Finer than default 0.001 for better gear tooth detail
-            angular_tolerance=0.05  # Finer than default 0.1 for curved surfaces
+            tolerance=worm_geo.linear_tol,
+            angular_tolerance=worm_geo.angular_tol
         )
 
         with open(temp_stl_path, 'rb') as f:
@@ -567,14 +571,15 @@ if generate_type in ['wheel', 'both']:
             with tempfile.NamedTemporaryFile(mode='w', suffix='.3mf', delete=False) as tmp:
                 temp_3mf_path = tmp.name
 
-            # Use build123d Mesher for 3MF export with finer mesh settings
-            # Lower deflection values = finer mesh, may help avoid duplicate vertex issues
+            # Mesh once at the geometry's tessellation tolerances (finer than
+            # the build123d defaults); 3MF and STL export reuse the triangulation
+            wheel = wheel_geo.tessellate()
             from build123d import Mesher, Unit
             mesher = Mesher(unit=Unit.MM)
             mesher.add_shape(
                 wheel,
-                linear_deflection=0.0005,   # Finer than default 0.001
-                angular_deflection=0.05     # Finer than default 0.1
+                linear_deflection=wheel_geo.linear_tol,
+                angular_deflection=wheel_geo.angular_tol
             )
             mesher.write(temp_3mf_path)
 
@@ -593,17 +598,17 @@ if generate_type in ['wheel', 'both']:
             wheel_3mf_b64 = None
 
         # Also export STL for compatibility
-        # Use finer mesh settings consistent with 3MF export for better detail
+        # Same tolerances as the 3MF export, so the existing mesh is reused
         print("  Exporting to STL format...")
         with tempfile.NamedTemporaryFile(mode='w', suffix='.stl', delete=False) as tmp:
             temp_stl_path = tmp.name
 
         from build123d import export_stl
         export_stl(
-            wheel,
+            wheel_geo.tessellate(),
             temp_stl_path,
-            tolerance=0.0005,       # Finer than default 0.001 for better gear tooth detail
-            angular_tolerance=0.05  # Finer than default 0.1 for curved surfaces
+            tolerance=wheel_geo.linear_tol,
+            angular_tolerance=wheel_geo.angular_tol
         )
 
         with open(temp_stl_path, 'rb') as f: